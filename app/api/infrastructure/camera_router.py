@@ -1,16 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
-from fastapi.responses import StreamingResponse, Response
+from typing import Optional, Dict, Any, List, Literal
+from fastapi.responses import JSONResponse, StreamingResponse, Response
+from types import MappingProxyType
 import logging
 import os
 
 from ...camera.application.use_cases import (
     ShootCameraUseCase,
-    TakeLiveViewSnapshotUseCase,
-    StartLiveViewStreamUseCase,
     TakeLiveViewSnapshotRequest,
-    StartLiveViewStreamRequest,
     ManualShootingUseCase,
     ManualShootingRequest,
 )
@@ -18,6 +16,20 @@ from ...camera.infrastructure.container import get_camera_container
 from ...camera.infrastructure.error_handling_service import (
     get_error_handling_service,
 )
+from .request_id_middleware import get_request_id
+
+# Cache-busting headers shared by every image response
+_NO_CACHE_HEADERS = MappingProxyType(
+    {
+        "Cache-Control": "no-cache, no-store, must-revalidate",
+        "Pragma": "no-cache",
+        "Expires": "0",
+    }
+)
+
+# Multipart framing written around each live view JPEG
+_FRAME_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+_FRAME_TRAILER = b"\r\n"
 
 
 class ShootCameraResponseModel(BaseModel):
@@ -98,12 +110,11 @@ def create_camera_router() -> APIRouter:
 
     @router.post("/shoot")
     async def shoot_camera(
-        request: Request,
         container=Depends(get_camera_container_dependency),
         error_service=Depends(get_error_handling_service_dependency),
     ):
         """Take a single photo with the camera."""
-        request_id = str(request.headers.get("X-Request-ID", ""))
+        request_id = get_request_id()
 
         try:
             logger.info("📸 Starting camera shooting")
@@ -122,13 +133,16 @@ def create_camera_router() -> APIRouter:
 
             if result.success:
                 logger.info(f"✅ Camera shooting successful: {result.message}")
-                return error_service.create_success_response(
-                    {
-                        "message": result.message,
-                        "shooting_id": result.shooting_id,
-                        "image_path": result.image_path,
-                    },
-                    request_id,
+                # The payload is already JSON-ready, so skip jsonable_encoder
+                return JSONResponse(
+                    content=error_service.create_success_response(
+                        {
+                            "message": result.message,
+                            "shooting_id": result.shooting_id,
+                            "image_path": result.image_path,
+                        },
+                        request_id,
+                    )
                 )
             else:
                 logger.error(f"❌ Camera shooting failed: {result.message}")
@@ -150,13 +164,12 @@ def create_camera_router() -> APIRouter:
 
     @router.post("/manual-shoot")
     async def manual_shoot(
-        request: Request,
         shooting_request: ManualShootingRequestModel,
         container=Depends(get_camera_container_dependency),
         error_service=Depends(get_error_handling_service_dependency),
     ):
         """Take photos with manual camera settings."""
-        request_id = str(request.headers.get("X-Request-ID", ""))
+        request_id = get_request_id()
 
         try:
             logger.info(f"📸 Starting manual shooting: {shooting_request.shots} shots")
@@ -186,14 +199,16 @@ def create_camera_router() -> APIRouter:
                 logger.info(
                     f"✅ Manual shooting successful: {result.images_captured} images"
                 )
-                return error_service.create_success_response(
-                    {
-                        "message": result.message,
-                        "shooting_id": result.shooting_id,
-                        "images_captured": result.images_captured,
-                        "image_paths": result.image_paths,
-                    },
-                    request_id,
+                return JSONResponse(
+                    content=error_service.create_success_response(
+                        {
+                            "message": result.message,
+                            "shooting_id": result.shooting_id,
+                            "images_captured": result.images_captured,
+                            "image_paths": result.image_paths,
+                        },
+                        request_id,
+                    )
                 )
             else:
                 logger.error(f"❌ Manual shooting failed: {result.message}")
@@ -215,13 +230,12 @@ def create_camera_router() -> APIRouter:
 
     @router.get("/live-view/snapshot")
     async def take_live_view_snapshot(
-        request: Request,
         quality: Optional[int] = Query(None, description="JPEG quality (1-100)"),
         container=Depends(get_camera_container_dependency),
         error_service=Depends(get_error_handling_service_dependency),
     ):
         """Take a live view snapshot."""
-        request_id = str(request.headers.get("X-Request-ID", ""))
+        request_id = get_request_id()
 
         try:
             logger.info(f"📸 Taking live view snapshot with quality={quality}")
@@ -243,7 +257,8 @@ def create_camera_router() -> APIRouter:
                 else:
                     quality = 80  # Fallback default
 
-            use_case = TakeLiveViewSnapshotUseCase(camera_service)
+            # Concurrent requests share a single capture
+            use_case = container.snapshot_use_case
             request_data = TakeLiveViewSnapshotRequest()
 
             result = await use_case.execute(request_data)
@@ -252,12 +267,7 @@ def create_camera_router() -> APIRouter:
                 logger.info(f"✅ Live view snapshot successful: {result.message}")
 
                 # Add cache-busting headers to prevent browser caching
-                headers = {
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache",
-                    "Expires": "0",
-                    "X-Request-ID": request_id,
-                }
+                headers = {**_NO_CACHE_HEADERS, "X-Request-ID": request_id}
 
                 return Response(
                     content=result.image_data,
@@ -284,7 +294,6 @@ def create_camera_router() -> APIRouter:
 
     @router.get("/live-view/stream")
     async def start_live_view_stream(
-        request: Request,
         framerate: Optional[float] = Query(
             None, description="Frames per second (0.1-8.0)"
         ),
@@ -293,7 +302,7 @@ def create_camera_router() -> APIRouter:
         error_service=Depends(get_error_handling_service_dependency),
     ):
         """Start a live view stream."""
-        request_id = str(request.headers.get("X-Request-ID", ""))
+        request_id = get_request_id()
 
         try:
             logger.info(
@@ -350,25 +359,18 @@ def create_camera_router() -> APIRouter:
                 )
                 raise HTTPException(status_code=400, detail=error_response.to_dict())
 
-            use_case = StartLiveViewStreamUseCase(camera_service)
-            request_data = StartLiveViewStreamRequest(
-                framerate=framerate, quality=quality
-            )
-
-            # Get the async generator (don't await it!)
-            stream_generator = use_case.execute(request_data)
+            # All clients share the camera's single capture loop
+            frames = container.live_view_frames(framerate, quality)
 
             # Create a generator function that converts LiveViewResult to bytes
             async def generate_stream():
-                async for result in stream_generator:
+                async for result in frames:
                     if result.success and result.image_data:
-                        # Format as multipart stream frame
-                        yield (
-                            b"--frame\r\n"
-                            b"Content-Type: image/jpeg\r\n\r\n"
-                            + result.image_data
-                            + b"\r\n"
-                        )
+                        # Send the shared JPEG buffer as is instead of
+                        # concatenating a framed copy for every client
+                        yield _FRAME_HEADER
+                        yield result.image_data
+                        yield _FRAME_TRAILER
                     else:
                         # Stream ended or error occurred
                         logger.warning(f"Stream result: {result.message}")
@@ -377,12 +379,7 @@ def create_camera_router() -> APIRouter:
             logger.info("✅ Live view stream started successfully")
 
             # Add cache-busting headers
-            headers = {
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0",
-                "X-Request-ID": request_id,
-            }
+            headers = {**_NO_CACHE_HEADERS, "X-Request-ID": request_id}
 
             return StreamingResponse(
                 generate_stream(),
@@ -407,12 +404,14 @@ def create_camera_router() -> APIRouter:
 
     @router.get("/last-picture")
     async def get_last_picture(
-        request: Request,
+        size: Literal["full", "thumb"] = Query(
+            "full", description="Full resolution image or a small preview"
+        ),
         container=Depends(get_camera_container_dependency),
         error_service=Depends(get_error_handling_service_dependency),
     ):
         """Get the last picture taken by the camera."""
-        request_id = str(request.headers.get("X-Request-ID", ""))
+        request_id = get_request_id()
 
         try:
             logger.info("🖼️ Getting last picture")
@@ -453,18 +452,40 @@ def create_camera_router() -> APIRouter:
                 )
                 raise HTTPException(status_code=404, detail=error_response.to_dict())
 
+            image_file_path = latest_image_path
+
+            # Serve a cached, downscaled copy for dashboard previews
+            if size == "thumb":
+                image_service = container.image_service
+                thumbnail_path = (
+                    await image_service.get_thumbnail(latest_image_path)
+                    if image_service
+                    else None
+                )
+                if not thumbnail_path:
+                    error_response = error_service.handle_error(
+                        RuntimeError("Could not create thumbnail"),
+                        {
+                            "operation": "get_last_picture",
+                            "file_path": latest_image_path,
+                        },
+                        request_id,
+                    )
+                    raise HTTPException(
+                        status_code=500, detail=error_response.to_dict()
+                    )
+                image_file_path = thumbnail_path
+
             # Read the image file
             try:
-                with open(latest_image_path, "rb") as f:
+                with open(image_file_path, "rb") as f:
                     image_data = f.read()
 
                 logger.info(f"✅ Last picture retrieved: {latest_image_path}")
 
                 # Add cache-busting headers
                 headers = {
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache",
-                    "Expires": "0",
+                    **_NO_CACHE_HEADERS,
                     "X-Request-ID": request_id,
                     "Content-Disposition": f"attachment; filename={os.path.basename(latest_image_path)}",
                 }
@@ -494,12 +515,11 @@ def create_camera_router() -> APIRouter:
 
     @router.get("/configuration")
     async def get_configuration(
-        request: Request,
         container=Depends(get_camera_container_dependency),
         error_service=Depends(get_error_handling_service_dependency),
     ):
         """Get current application configuration."""
-        request_id = str(request.headers.get("X-Request-ID", ""))
+        request_id = get_request_id()
 
         try:
             logger.info("⚙️ Getting application configuration")
@@ -529,46 +549,7 @@ def create_camera_router() -> APIRouter:
                 )
 
             return error_service.create_success_response(
-                {
-                    "status": "complete",
-                    "camera": {
-                        "chdkptp_location": config.camera.chdkptp_location,
-                        "output_directory": config.camera.output_directory,
-                        "frame_file_name": config.camera.frame_file_name,
-                        "default_jpeg_quality": (config.camera.default_jpeg_quality),
-                        "max_framerate": config.camera.max_framerate,
-                        "command_timeout": config.camera.command_timeout,
-                    },
-                    "image_processing": {
-                        "default_jpeg_quality": (
-                            config.image_processing.default_jpeg_quality
-                        ),
-                        "timestamp_font_scale": (
-                            config.image_processing.timestamp_font_scale
-                        ),
-                        "timestamp_font_thickness": (
-                            config.image_processing.timestamp_font_thickness
-                        ),
-                        "timestamp_color": (config.image_processing.timestamp_color),
-                        "timestamp_outline_color": (
-                            config.image_processing.timestamp_outline_color
-                        ),
-                    },
-                    "environment": {
-                        "environment": config.environment.environment,
-                        "debug": config.environment.debug,
-                        "log_level": config.environment.log_level,
-                        "log_format": config.environment.log_format,
-                        "enable_authentication": (
-                            config.environment.enable_authentication
-                        ),
-                        "api_key_required": (config.environment.api_key_required),
-                        "max_concurrent_streams": (
-                            config.environment.max_concurrent_streams
-                        ),
-                        "stream_buffer_size": (config.environment.stream_buffer_size),
-                    },
-                },
+                {"status": "complete", **config_service.configuration_dict},
                 request_id,
             )
 
@@ -583,12 +564,11 @@ def create_camera_router() -> APIRouter:
 
     @router.post("/configuration/reload")
     async def reload_configuration(
-        request: Request,
         container=Depends(get_camera_container_dependency),
         error_service=Depends(get_error_handling_service_dependency),
     ):
         """Reload application configuration."""
-        request_id = str(request.headers.get("X-Request-ID", ""))
+        request_id = get_request_id()
 
         try:
             logger.info("🔄 Reloading application configuration")
@@ -1,4 +1,4 @@
-import logging
+import asyncio
 from datetime import datetime
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -6,6 +6,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from .camera_router import create_camera_router
+from .request_id_middleware import RequestIDMiddleware, get_request_id
 from ...camera.infrastructure.error_handling_service import (
     get_error_handling_service,
 )
@@ -50,6 +51,10 @@ class TimelapseResponseModel(BaseModel):
     estimated_file_size_mb: float
 
 
+# Endpoints whose unhandled errors are recorded by the global exception handler
+_RECORDED_ENDPOINTS = frozenset({"/current", "/upcoming", "/timelapse"})
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application with error handling."""
     app = FastAPI(
@@ -67,21 +72,11 @@ def create_app() -> FastAPI:
 
     # Initialize error handling service
     error_service = get_error_handling_service()
-    logger = logging.getLogger(__name__)
-
-    # Add request ID middleware
-    @app.middleware("http")
-    async def add_request_id_middleware(request: Request, call_next):
-        """Add request ID to all requests."""
-        request_id = error_service.generate_request_id()
-        request.state.request_id = request_id
 
-        # Add request ID to response headers
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-
-        logger.info(f"Request {request_id} completed: {request.method} {request.url}")
-        return response
+    # Assign a request ID to every request and echo it in the response
+    app.add_middleware(
+        RequestIDMiddleware, generate_request_id=error_service.generate_request_id
+    )
 
     # Global exception handler
     @app.exception_handler(Exception)
@@ -89,6 +84,22 @@ def create_app() -> FastAPI:
         """Handle all unhandled exceptions."""
         request_id = getattr(request.state, "request_id", "unknown")
 
+        # Sun event endpoints don't catch their own failures; record them here,
+        # with the request data an endpoint attached to the request state
+        endpoint = request.url.path
+        if endpoint in _RECORDED_ENDPOINTS:
+            context = {"endpoint": endpoint}
+            request_data = getattr(request.state, "request_data", None)
+            if request_data is not None:
+                context["request_data"] = request_data
+            error_service.record_error(
+                ErrorType.APPLICATION_ERROR,
+                str(exc),
+                ErrorSeverity.MEDIUM,
+                request_id=request_id,
+                context=context,
+            )
+
         error_response = error_service.handle_exception(
             exc,
             request_id=request_id,
@@ -105,7 +116,8 @@ def create_app() -> FastAPI:
             headers={"X-Request-ID": request_id},
         )
 
-    # Initialize dependencies
+    # Initialize dependencies. The use cases are synchronous, so endpoints run
+    # them in a worker thread to keep repository work off the event loop
     sun_event_repository = JSONSunEventRepository()
     get_current_use_case = GetCurrentSunEventUseCase(sun_event_repository)
     get_upcoming_use_case = CheckUpcomingSunEventsUseCase(sun_event_repository)
@@ -120,131 +132,110 @@ def create_app() -> FastAPI:
         """Root endpoint."""
         return {"message": "Sun Events API", "version": "1.0.0"}
 
+    # Endpoints below build JSON-ready dicts and return JSONResponse directly,
+    # which skips FastAPI's jsonable_encoder pass over the payload
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "service": "Sun Events API",
-        }
+        return JSONResponse(
+            content={
+                "status": "healthy",
+                "timestamp": datetime.now().isoformat(),
+                "service": "Sun Events API",
+            }
+        )
 
     @app.get("/current")
-    async def get_current_event(request: Request):
+    async def get_current_event():
         """Get current sun event period if any."""
-        try:
-            response = get_current_use_case.execute(
-                GetCurrentEventRequest(current_time=datetime.now())
-            )
+        response = await asyncio.to_thread(
+            get_current_use_case.execute,
+            GetCurrentEventRequest(current_time=datetime.now()),
+        )
 
-            if response.current_period:
-                return {
+        if response.current_period:
+            return JSONResponse(
+                content={
                     "period_type": response.current_period.period_type,
                     "start_time": response.current_period.start_time.isoformat(),
                     "end_time": response.current_period.end_time.isoformat(),
                     "event_date": (
-                        response.current_period.event_date.strftime("%Y-%m-%d")
+                        response.current_period.event_date.date().isoformat()
                     ),
                 }
-            else:
-                return {"message": "No current sun event period"}
-
-        except Exception as e:
-            error_service.record_error(
-                ErrorType.APPLICATION_ERROR,
-                str(e),
-                ErrorSeverity.MEDIUM,
-                request_id=getattr(request.state, "request_id", "unknown"),
-                context={"endpoint": "/current"},
             )
-            raise
+        else:
+            return JSONResponse(content={"message": "No current sun event period"})
 
     @app.get("/upcoming")
-    async def get_upcoming_events(request: Request):
+    async def get_upcoming_events():
         """Get upcoming sun event periods."""
-        try:
-            response = get_upcoming_use_case.execute(
-                CheckUpcomingEventsRequest(
-                    current_time=datetime.now(), look_ahead_minutes=1440
-                )
-            )
-
-            upcoming_periods = []
-            for period in response.upcoming_periods:
-                upcoming_periods.append(
-                    {
-                        "period_type": period.period_type,
-                        "start_time": period.start_time.isoformat(),
-                        "end_time": period.end_time.isoformat(),
-                        "event_date": period.event_date.strftime("%Y-%m-%d"),
-                    }
-                )
-
-            return {"upcoming_periods": upcoming_periods}
+        response = await asyncio.to_thread(
+            get_upcoming_use_case.execute,
+            CheckUpcomingEventsRequest(
+                current_time=datetime.now(), look_ahead_minutes=1440
+            ),
+        )
 
-        except Exception as e:
-            error_service.record_error(
-                ErrorType.APPLICATION_ERROR,
-                str(e),
-                ErrorSeverity.MEDIUM,
-                request_id=getattr(request.state, "request_id", "unknown"),
-                context={"endpoint": "/upcoming"},
+        upcoming_periods = []
+        for period in response.upcoming_periods:
+            upcoming_periods.append(
+                {
+                    "period_type": period.period_type,
+                    "start_time": period.start_time.isoformat(),
+                    "end_time": period.end_time.isoformat(),
+                    "event_date": period.event_date.date().isoformat(),
+                }
             )
-            raise
+
+        return JSONResponse(content={"upcoming_periods": upcoming_periods})
 
     @app.post("/timelapse", response_model=TimelapseResponseModel)
     async def calculate_timelapse(
-        request: Request, timelapse_request: TimelapseRequestModel
+        timelapse_request: TimelapseRequestModel, request: Request
     ):
         """Calculate timelapse parameters for a sun event period."""
+        request_data = timelapse_request.model_dump()
+        request.state.request_data = request_data
         try:
-            response = calculate_timelapse_use_case.execute(
+            response = await asyncio.to_thread(
+                calculate_timelapse_use_case.execute,
                 CalculateTimelapseRequest(
                     period_type=timelapse_request.period_type,
                     video_duration_seconds=timelapse_request.video_duration_seconds,
                     video_fps=timelapse_request.video_fps,
                     photo_size_mb=timelapse_request.photo_size_mb,
-                )
-            )
-
-            params = response.timelapse_parameters
-            return TimelapseResponseModel(
-                period_type=params.period_type,
-                start_time=params.start_time.isoformat(),
-                end_time=params.end_time.isoformat(),
-                total_duration_seconds=params.total_duration_seconds,
-                video_duration_seconds=params.video_duration_seconds,
-                video_fps=params.video_fps,
-                total_frames=params.total_frames,
-                interval_seconds=params.interval_seconds,
-                photos_needed=params.photos_needed,
-                estimated_file_size_mb=params.estimated_file_size_mb,
+                ),
             )
-
         except ValueError as e:
             error_service.record_error(
                 ErrorType.VALIDATION_ERROR,
                 str(e),
                 ErrorSeverity.LOW,
-                request_id=getattr(request.state, "request_id", "unknown"),
+                request_id=get_request_id(),
                 context={
                     "endpoint": "/timelapse",
-                    "request_data": timelapse_request.dict(),
+                    "request_data": request_data,
                 },
             )
             raise HTTPException(status_code=400, detail=str(e))
 
-        except Exception as e:
-            error_service.record_error(
-                ErrorType.APPLICATION_ERROR,
-                str(e),
-                ErrorSeverity.MEDIUM,
-                request_id=getattr(request.state, "request_id", "unknown"),
-                context={
-                    "endpoint": "/timelapse",
-                    "request_data": timelapse_request.dict(),
-                },
-            )
-            raise
+        # Returning a response directly skips re-validating the payload
+        # against response_model, which is kept for the OpenAPI schema
+        params = response.timelapse_parameters
+        return JSONResponse(
+            content={
+                "period_type": params.period_type,
+                "start_time": params.start_time.isoformat(),
+                "end_time": params.end_time.isoformat(),
+                "total_duration_seconds": params.total_duration_seconds,
+                "video_duration_seconds": params.video_duration_seconds,
+                "video_fps": params.video_fps,
+                "total_frames": params.total_frames,
+                "interval_seconds": params.interval_seconds,
+                "photos_needed": params.photos_needed,
+                "estimated_file_size_mb": params.estimated_file_size_mb,
+            }
+        )
 
     return app
@@ -0,0 +1,79 @@
+import logging
+import re
+from contextvars import ContextVar
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+# Client IDs end up in logs and response headers, so only short IDs made of
+# safe characters are reused.
+MAX_REQUEST_ID_LENGTH = 128
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._-]+")
+
+_REQUEST_ID: ContextVar[str] = ContextVar("request_id", default="unknown")
+
+
+def get_request_id() -> str:
+    """Get the ID of the request being handled in the current context."""
+    return _REQUEST_ID.get()
+
+
+def _is_valid_request_id(request_id: str) -> bool:
+    """Check whether a client-supplied request ID is safe to reuse."""
+    return len(request_id) <= MAX_REQUEST_ID_LENGTH and bool(
+        _VALID_REQUEST_ID.fullmatch(request_id)
+    )
+
+
+class RequestIDMiddleware:
+    """Pure ASGI middleware that assigns a request ID to every HTTP request.
+
+    The client's X-Request-ID is reused when present and valid (at most 128
+    characters from [A-Za-z0-9._-]), otherwise a new one is generated. The ID
+    is stored on the request state and in a context variable read by
+    get_request_id(), and echoed back in the X-Request-ID response header.
+    """
+
+    def __init__(self, app: ASGIApp, generate_request_id: Callable[[], str]):
+        self.app = app
+        self.generate_request_id = generate_request_id
+        self.logger = logging.getLogger(__name__)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = ""
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")
+                break
+        if not _is_valid_request_id(request_id):
+            request_id = self.generate_request_id()
+
+        scope.setdefault("state", {})["request_id"] = request_id
+        encoded_request_id = request_id.encode("latin-1")
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", [])
+                    if name.lower() != REQUEST_ID_HEADER
+                ]
+                headers.append((REQUEST_ID_HEADER, encoded_request_id))
+                message["headers"] = headers
+            await send(message)
+
+        token = _REQUEST_ID.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            _REQUEST_ID.reset(token)
+
+        self.logger.info(
+            f"Request {request_id} completed: {scope['method']} {scope['path']}"
+        )
@@ -11,7 +11,7 @@ from ...sun_events.application.use_cases import (
 )
 from ...sun_events.domain.entities import SunEventPeriod
 from ...sun_events.domain.repositories import SunEventRepository
-from .sun_event_orchestrator import SunEventOrchestrator
+from .sun_event_orchestrator import SunEventOrchestrator, format_clock_time
 
 
 class SunEventMonitorService:
@@ -42,25 +42,52 @@ class SunEventMonitorService:
         self.logger = logging.getLogger(__name__)
         self._is_running = False
         self._current_period: Optional[SunEventPeriod] = None
+        self._wake_event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def start(self):
         """Start the background monitoring service."""
         self._is_running = True
+        self._loop = asyncio.get_running_loop()
         self.logger.info("Starting sun event monitor service")
 
         while self._is_running:
             try:
                 wait_seconds = await self._execute_monitor_cycle()
                 if wait_seconds > 0:
-                    await asyncio.sleep(wait_seconds)
+                    await self._wait(wait_seconds)
             except Exception as e:
                 self.logger.error(f"Error in monitor cycle: {e}")
-                await asyncio.sleep(self.error_retry_seconds)
+                await self._wait(self.error_retry_seconds)
+
+        await self.orchestrator.shutdown()
 
     def stop(self):
         """Stop the background monitoring service."""
         self._is_running = False
         self.logger.info("Stopping sun event monitor service")
+        self._signal_wake()
+
+    def wake(self):
+        """Interrupt the current wait so the next cycle runs immediately."""
+        self._signal_wake()
+
+    async def _wait(self, seconds: float):
+        """Sleep for up to the given seconds, returning early when woken."""
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._wake_event.clear()
+
+    def _signal_wake(self):
+        """Set the wake event, which is safe to call from any thread."""
+        loop = self._loop
+        if loop and loop.is_running():
+            loop.call_soon_threadsafe(self._wake_event.set)
+        else:
+            self._wake_event.set()
 
     async def _execute_monitor_cycle(self) -> float:
         """Execute one monitoring cycle and return wait time in seconds."""
@@ -119,19 +146,19 @@ class SunEventMonitorService:
         )
 
         if upcoming_response.upcoming_periods:
-            self._log_upcoming_periods(upcoming_response.upcoming_periods)
+            self._log_upcoming_periods(upcoming_response.upcoming_periods, current_time)
 
-            # Find the first upcoming period
-            first_period = min(
-                upcoming_response.upcoming_periods, key=lambda p: p.start_time
-            )
-            wait_seconds = (first_period.start_time - current_time).total_seconds()
+            # Upcoming periods are returned sorted by start time
+            first_period = upcoming_response.upcoming_periods[0]
+            wait_seconds = (
+                upcoming_response.earliest_start - current_time
+            ).total_seconds()
 
             if wait_seconds > 0:
                 self.logger.info(
                     f"Next {first_period.period_type} period starts in "
                     f"{wait_seconds:.0f} seconds "
-                    f"(at {first_period.start_time.strftime('%H:%M:%S')})"
+                    f"(at {format_clock_time(first_period.start_time)})"
                 )
             else:
                 # Period should start now, continue immediately
@@ -145,16 +172,21 @@ class SunEventMonitorService:
             )
             return self.no_events_retry_seconds
 
-    def _log_upcoming_periods(self, periods: list[SunEventPeriod]):
-        """Log upcoming sun event periods."""
+    def _log_upcoming_periods(
+        self, periods: list[SunEventPeriod], reference_time: datetime
+    ):
+        """Log upcoming sun event periods relative to the cycle's reference time."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         self.logger.info("🔍 UPCOMING SUN EVENTS:")
         for period in periods:
-            time_until_start = (period.start_time - datetime.now()).total_seconds() / 60
+            time_until_start = (period.start_time - reference_time).total_seconds() / 60
 
             self.logger.info(
                 f"   {period.period_type.upper()}: "
-                f"{period.start_time.strftime('%H:%M:%S')} - "
-                f"{period.end_time.strftime('%H:%M:%S')} "
+                f"{format_clock_time(period.start_time)} - "
+                f"{format_clock_time(period.end_time)} "
                 f"(in {time_until_start:.0f} minutes)"
             )
 
@@ -1,6 +1,16 @@
+import asyncio
 import logging
-from typing import Optional
+import random
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Set
 
+from ...camera.domain.entities import (
+    AutoShootParams,
+    CameraCommand,
+    format_date_stamp,
+)
 from ...camera.domain.services import CameraControlService
 from ...sun_events.domain.entities import SunEventPeriod
 from ...sun_events.domain.repositories import SunEventRepository
@@ -12,6 +22,30 @@ from ...video_processing.infrastructure.ffmpeg_video_processor import (
     FFmpegVideoProcessor,
 )
 
+IMAGES_DIR = Path("/home/arrumada/Images")
+VIDEOS_DIR = Path("/home/arrumada/Videos")
+
+# Retries while the camera may still be waking up when a period starts
+CAMERA_CONNECT_RETRIES = 3
+CAMERA_CONNECT_BASE_DELAY = 0.1
+CAMERA_CONNECT_MAX_WAIT = 2.0
+
+
+@dataclass
+class VideoSettings:
+    """Settings for the video rendered at the end of each period."""
+
+    photos_directory: Path = IMAGES_DIR
+    videos_directory: Path = VIDEOS_DIR
+    fps: int = 60
+    video_duration_seconds: int = 20
+    quality: str = "high"
+
+
+def format_clock_time(value: datetime) -> str:
+    """Format a datetime as HH:MM:SS without going through strftime."""
+    return value.time().isoformat(timespec="seconds")
+
 
 class SunEventOrchestrator:
     """Orchestrates actions when sun events occur."""
@@ -22,14 +56,18 @@ class SunEventOrchestrator:
         timelapse_use_case: CalculateTimelapseUseCase,
         camera_control_service: Optional[CameraControlService],
         video_processor: FFmpegVideoProcessor,
+        video_settings: Optional[VideoSettings] = None,
     ):
         self.sun_event_repository = sun_event_repository
         self.timelapse_use_case = timelapse_use_case
         self.camera_control_service = camera_control_service
         self.video_processor = video_processor
+        self.video_settings = video_settings or VideoSettings()
 
         self.logger = logging.getLogger(__name__)
         self._current_recording_period: Optional[SunEventPeriod] = None
+        self._recording_task: Optional[asyncio.Task] = None
+        self._video_tasks: Set[asyncio.Task] = set()
 
     async def handle_period_start(self, period: SunEventPeriod):
         """Handle the start of a sun event period."""
@@ -60,30 +98,51 @@ class SunEventOrchestrator:
                 self._current_recording_period
                 and self._current_recording_period == period
             ):
-                await self._process_video(period)
+                # Encode in the background so monitoring isn't blocked meanwhile
+                recording_task, self._recording_task = self._recording_task, None
+                task = asyncio.create_task(self._process_video(period, recording_task))
+                self._video_tasks.add(task)
+                task.add_done_callback(self._video_tasks.discard)
                 self._current_recording_period = None
 
         except Exception as e:
             self.logger.error(f"Error handling period end: {e}")
 
+    async def shutdown(self):
+        """Stop recording and wait for video processing still in the background."""
+        if self._recording_task:
+            self._recording_task.cancel()
+        if self._video_tasks:
+            self.logger.info(
+                f"🎬 Waiting for {len(self._video_tasks)} video processing task(s)"
+            )
+            await asyncio.gather(*self._video_tasks, return_exceptions=True)
+
     async def _calculate_timelapse_parameters(self, period: SunEventPeriod):
         """Calculate and log timelapse parameters."""
         try:
             response = self.timelapse_use_case.execute(
-                CalculateTimelapseRequest(period_type=period.period_type)
+                CalculateTimelapseRequest(
+                    period_type=period.period_type,
+                    video_duration_seconds=self.video_settings.video_duration_seconds,
+                    video_fps=self.video_settings.fps,
+                )
             )
 
             params = response.timelapse_parameters
-            self.logger.info(
-                f"📹 TIMELAPSE PARAMETERS for {period.period_type.upper()}:\n"
-                f"   Period: {params.start_time.strftime('%H:%M:%S')} - "
-                f"{params.end_time.strftime('%H:%M:%S')}\n"
-                f"   Total duration: {params.total_duration_seconds / 60:.1f} minutes\n"
-                f"   Video: {params.video_duration_seconds}s at {params.video_fps}fps\n"
-                f"   Photos needed: {params.photos_needed}\n"
-                f"   Interval: {params.interval_seconds:.1f} seconds\n"
-                f"   Estimated size: {params.estimated_file_size_mb:.1f} MB"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"📹 TIMELAPSE PARAMETERS for {period.period_type.upper()}:\n"
+                    f"   Period: {format_clock_time(params.start_time)} - "
+                    f"{format_clock_time(params.end_time)}\n"
+                    f"   Total duration: "
+                    f"{params.total_duration_seconds / 60:.1f} minutes\n"
+                    f"   Video: {params.video_duration_seconds}s "
+                    f"at {params.video_fps}fps\n"
+                    f"   Photos needed: {params.photos_needed}\n"
+                    f"   Interval: {params.interval_seconds:.1f} seconds\n"
+                    f"   Estimated size: {params.estimated_file_size_mb:.1f} MB"
+                )
 
             return params
 
@@ -100,39 +159,87 @@ class SunEventOrchestrator:
                 return
 
             # Check if camera is connected
-            if not await self.camera_control_service.is_camera_connected():
+            if not await self._wait_for_camera_connection():
                 self.logger.warning("Camera not connected, skipping recording")
                 return
 
-            # Start recording
-            response = await self.start_recording_use_case.execute()
+            # A period joined late only has time left for part of the photos
+            interval = timelapse_params.interval_seconds
+            remaining_seconds = (period.end_time - datetime.now()).total_seconds()
+            shots = min(
+                timelapse_params.photos_needed, int(remaining_seconds / interval)
+            )
+            if shots <= 0:
+                self.logger.warning("No time left in the period, skipping recording")
+                return
 
-            if response.success:
-                self.logger.info(f"📸 Camera recording started: {response.message}")
-                self.logger.info(
-                    f"📸 Will take {timelapse_params.photos_needed} photos "
-                    f"every {timelapse_params.interval_seconds:.1f} seconds"
-                )
-            else:
-                self.logger.error(
-                    f"📸 Failed to start camera recording: {response.message}"
-                )
+            # The camera paces the whole series itself; run it in the
+            # background so monitoring isn't blocked for the whole period
+            command = CameraCommand(
+                command_type="auto_shoot",
+                parameters=AutoShootParams(shots=shots, interval=interval),
+            )
+            self._recording_task = asyncio.create_task(self._record(command))
+            self.logger.info(
+                f"📸 Camera recording started: {shots} photos "
+                f"every {interval:.1f} seconds"
+            )
 
         except Exception as e:
             self.logger.error(f"Error starting camera recording: {e}")
 
-    async def _process_video(self, period: SunEventPeriod):
+    async def _record(self, command: CameraCommand):
+        """Take the timelapse photos and log the outcome."""
+        try:
+            result = await self.camera_control_service.execute_command(command)
+            if result.success:
+                self.logger.info(f"📸 Camera recording finished: {result.message}")
+            else:
+                self.logger.error(f"📸 Camera recording failed: {result.message}")
+        except Exception as e:
+            self.logger.error(f"Error during camera recording: {e}")
+
+    async def _wait_for_camera_connection(self) -> bool:
+        """Check the camera connection, retrying with jittered backoff."""
+        waited = 0.0
+        for attempt in range(CAMERA_CONNECT_RETRIES + 1):
+            if await self.camera_control_service.is_camera_connected():
+                return True
+            if attempt == CAMERA_CONNECT_RETRIES:
+                break
+
+            delay = CAMERA_CONNECT_BASE_DELAY * (2**attempt + random.random())
+            delay = min(delay, CAMERA_CONNECT_MAX_WAIT - waited)
+            if delay <= 0:
+                break
+            self.logger.info(f"📸 Camera not connected, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            waited += delay
+        return False
+
+    async def _process_video(
+        self, period: SunEventPeriod, recording_task: Optional[asyncio.Task] = None
+    ):
         """Process video for completed recording."""
         try:
+            # The last photos may still be downloading when the period ends
+            if recording_task is not None:
+                await recording_task
+
             self.logger.info(f"🎬 Starting video processing for {period.period_type}")
 
             # Process video directly
+            settings = self.video_settings
+            output_video_path = (
+                settings.videos_directory
+                / f"{period.period_type}_{format_date_stamp(period.event_date)}.mp4"
+            )
             success = await self.video_processor.create_video_from_photos(
-                photos_directory="/home/arrumada/Images",
-                output_video_path=f"/home/arrumada/Videos/{period.period_type}_{period.event_date.strftime('%Y%m%d')}.mp4",
-                fps=60,
-                video_duration_seconds=20,
-                quality="high",
+                photos_directory=str(settings.photos_directory),
+                output_video_path=str(output_video_path),
+                fps=settings.fps,
+                video_duration_seconds=settings.video_duration_seconds,
+                quality=settings.quality,
             )
 
             if success:
@@ -149,22 +256,28 @@ class SunEventOrchestrator:
 
     def _log_period_start(self, period: SunEventPeriod):
         """Log when a sun event period starts."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         duration_minutes = (period.end_time - period.start_time).total_seconds() / 60
 
         self.logger.info(
             f"🌅 {period.period_type.upper()} PERIOD STARTING\n"
-            f"   Date: {period.event_date.strftime('%Y-%m-%d')}\n"
-            f"   Start: {period.start_time.strftime('%H:%M:%S')}\n"
-            f"   End: {period.end_time.strftime('%H:%M:%S')}\n"
+            f"   Date: {period.event_date.date().isoformat()}\n"
+            f"   Start: {format_clock_time(period.start_time)}\n"
+            f"   End: {format_clock_time(period.end_time)}\n"
             f"   Duration: {duration_minutes:.0f} minutes"
         )
 
     def _log_period_end(self, period: SunEventPeriod):
         """Log when a sun event period ends."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         duration_minutes = (period.end_time - period.start_time).total_seconds() / 60
 
         self.logger.info(
             f"🌅 {period.period_type.upper()} PERIOD ENDED\n"
-            f"   Date: {period.event_date.strftime('%Y-%m-%d')}\n"
+            f"   Date: {period.event_date.date().isoformat()}\n"
             f"   Duration: {duration_minutes:.0f} minutes"
         )
@@ -1,18 +1,40 @@
-from dataclasses import dataclass
-from typing import Optional, AsyncGenerator
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Optional, AsyncGenerator, Mapping, Tuple
+import asyncio
 import logging
 
 from ..domain.entities import (
+    AutoShootParams,
+    BurstShootParams,
     CameraCommand,
+    CameraCommandParameters,
+    CameraControlError,
     LiveViewResult,
     LiveViewStream,
     Result,
     ManualShootingParameters,
+    ShootParams,
 )
 from ..domain.services import CameraControlService
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Expected camera failures, logged without a traceback. Any other exception
+# is also reported as an unsuccessful response, but logged with its traceback.
+CAMERA_ERRORS = (CameraControlError, OSError)
+
+# Parameter type expected by each supported command
+COMMAND_PARAMETERS = MappingProxyType(
+    {
+        "shoot": ShootParams,
+        "auto_shoot": AutoShootParams,
+        "burst_shoot": BurstShootParams,
+    }
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ShootCameraResponse:
     """Response for shooting camera."""
 
@@ -22,15 +44,15 @@ class ShootCameraResponse:
     image_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecuteCommandRequest:
     """Request for executing a camera command."""
 
     command_type: str
-    parameters: dict
+    parameters: Mapping[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecuteCommandResponse:
     """Response for executing a camera command."""
 
@@ -40,14 +62,14 @@ class ExecuteCommandResponse:
     image_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TakeLiveViewSnapshotRequest:
     """Request for taking a live view snapshot."""
 
     include_overlay: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TakeLiveViewSnapshotResponse:
     """Response for taking a live view snapshot."""
 
@@ -57,15 +79,32 @@ class TakeLiveViewSnapshotResponse:
     image_format: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StartLiveViewStreamRequest:
     """Request for starting a live view stream."""
 
     framerate: float = 5.0
     quality: int = 80
+    stream_config: LiveViewStream = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Validate stream configuration and build it once for every start."""
+        if self.framerate <= 0:
+            raise ValueError("Framerate must be greater than 0")
+        if self.framerate > 8.0:
+            raise ValueError(
+                "Framerate cannot exceed 8.0 FPS due to hardware limitations"
+            )
+        if self.quality < 1 or self.quality > 100:
+            raise ValueError("Quality must be between 1 and 100")
+        object.__setattr__(
+            self,
+            "stream_config",
+            LiveViewStream(framerate=self.framerate, quality=self.quality),
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ManualShootingRequest:
     """Request for manual shooting."""
 
@@ -76,7 +115,7 @@ class ManualShootingRequest:
     interval: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ManualShootingResponse:
     """Response for manual shooting."""
 
@@ -84,7 +123,7 @@ class ManualShootingResponse:
     message: str
     shooting_id: Optional[str] = None
     images_captured: int = 0
-    image_paths: list[str] = None
+    image_paths: Tuple[str, ...] = ()
 
 
 class ShootCameraUseCase:
@@ -92,12 +131,11 @@ class ShootCameraUseCase:
 
     def __init__(self, camera_control_service: CameraControlService):
         self.camera_control_service = camera_control_service
-        self.logger = logging.getLogger(__name__)
 
     async def execute(self) -> ShootCameraResponse:
         """Execute the use case."""
         try:
-            self.logger.info("Executing shoot camera use case")
+            logger.info("Executing shoot camera use case")
 
             # Shoot camera
             result = await self.camera_control_service.shoot_camera()
@@ -110,10 +148,13 @@ class ShootCameraUseCase:
             )
 
         except Exception as e:
-            self.logger.error(f"Error in shoot camera use case: {e}")
+            logger.error(
+                f"Error in shoot camera use case: {e}",
+                exc_info=not isinstance(e, CAMERA_ERRORS),
+            )
             return ShootCameraResponse(
                 success=False,
-                message=f"Error shooting camera: {str(e)}",
+                message=f"Error shooting camera: {e}",
             )
 
 
@@ -122,23 +163,37 @@ class ExecuteCommandUseCase:
 
     def __init__(self, camera_control_service: CameraControlService):
         self.camera_control_service = camera_control_service
-        self.logger = logging.getLogger(__name__)
 
-    def _validate_command(self, request: ExecuteCommandRequest) -> Result[None]:
-        """Validate command request."""
+    def _validate_command(
+        self, request: ExecuteCommandRequest
+    ) -> Result[CameraCommandParameters]:
+        """Validate command request and build its typed parameters.
+
+        Command requests come straight from API input, so an unknown command
+        is reported as an unsuccessful response rather than raised.
+        """
         if not request.command_type:
             return Result.failure("Command type is required")
 
-        valid_commands = {"shoot", "auto_shoot", "burst_shoot"}
-        if request.command_type not in valid_commands:
+        parameters_type = COMMAND_PARAMETERS.get(request.command_type)
+        if parameters_type is None:
             return Result.failure(f"Invalid command type: {request.command_type}")
 
-        return Result.success(None)
+        try:
+            parameters = parameters_type(**request.parameters)
+        except TypeError:
+            return Result.failure(
+                f"Invalid parameters for {request.command_type}: "
+                f"{', '.join(request.parameters)}"
+            )
+
+        return Result.success(parameters)
 
     async def execute(self, request: ExecuteCommandRequest) -> ExecuteCommandResponse:
         """Execute the use case."""
         try:
-            self.logger.info(f"Executing command use case: {request.command_type}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Executing command use case: {request.command_type}")
 
             # Validate command
             validation_result = self._validate_command(request)
@@ -150,7 +205,7 @@ class ExecuteCommandUseCase:
             # Create camera command
             command = CameraCommand(
                 command_type=request.command_type,
-                parameters=request.parameters,
+                parameters=validation_result.value,
             )
 
             # Execute command
@@ -164,26 +219,52 @@ class ExecuteCommandUseCase:
             )
 
         except Exception as e:
-            self.logger.error(f"Error in execute command use case: {e}")
+            logger.error(
+                f"Error in execute command use case: {e}",
+                exc_info=not isinstance(e, CAMERA_ERRORS),
+            )
             return ExecuteCommandResponse(
                 success=False,
-                message=f"Error executing command: {str(e)}",
+                message=f"Error executing command: {e}",
             )
 
 
 class TakeLiveViewSnapshotUseCase:
-    """Use case for taking a live view snapshot."""
+    """Use case for taking a live view snapshot.
+
+    Callers that ask for a snapshot while one is already being captured with
+    the same settings wait for that capture instead of starting another one.
+    """
 
     def __init__(self, camera_control_service: CameraControlService):
         self.camera_control_service = camera_control_service
-        self.logger = logging.getLogger(__name__)
+        self._inflight: Dict[bool, asyncio.Future] = {}
 
     async def execute(
         self, request: TakeLiveViewSnapshotRequest
     ) -> TakeLiveViewSnapshotResponse:
         """Execute the use case."""
+        key = request.include_overlay
+        future = self._inflight.get(key)
+        if future is None or future.done():
+            future = asyncio.ensure_future(self._take_snapshot(request))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+
+        # Shield the shared capture from callers that go away while waiting
+        return await asyncio.shield(future)
+
+    def _forget(self, key: bool, future: asyncio.Future) -> None:
+        """Drop a finished capture so the next request takes a new snapshot."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    async def _take_snapshot(
+        self, request: TakeLiveViewSnapshotRequest
+    ) -> TakeLiveViewSnapshotResponse:
+        """Take one snapshot from the camera."""
         try:
-            self.logger.info("Executing take live view snapshot use case")
+            logger.info("Executing take live view snapshot use case")
 
             # Take live view snapshot
             result = await self.camera_control_service.take_live_view_snapshot(
@@ -198,12 +279,13 @@ class TakeLiveViewSnapshotUseCase:
             )
 
         except Exception as e:
-            self.logger.error(f"Error in take live view snapshot use case: {e}")
+            logger.error(
+                f"Error in take live view snapshot use case: {e}",
+                exc_info=not isinstance(e, CAMERA_ERRORS),
+            )
             return TakeLiveViewSnapshotResponse(
                 success=False,
-                message=f"Error taking live view snapshot: {str(e)}",
-                image_data=None,
-                image_format=None,
+                message=f"Error taking live view snapshot: {e}",
             )
 
 
@@ -212,62 +294,29 @@ class StartLiveViewStreamUseCase:
 
     def __init__(self, camera_control_service: CameraControlService):
         self.camera_control_service = camera_control_service
-        self.logger = logging.getLogger(__name__)
-
-    def _validate_stream_config(
-        self, request: StartLiveViewStreamRequest
-    ) -> Result[None]:
-        """Validate stream configuration."""
-        if request.framerate <= 0:
-            return Result.failure("Framerate must be greater than 0")
-
-        if request.framerate > 8.0:
-            return Result.failure(
-                "Framerate cannot exceed 8.0 FPS due to hardware limitations"
-            )
-
-        if request.quality < 1 or request.quality > 100:
-            return Result.failure("Quality must be between 1 and 100")
-
-        return Result.success(None)
 
     async def execute(
         self, request: StartLiveViewStreamRequest
     ) -> AsyncGenerator[LiveViewResult, None]:
         """Execute the use case."""
         try:
-            self.logger.info("Executing start live view stream use case")
-
-            # Validate configuration
-            validation_result = self._validate_stream_config(request)
-            if not validation_result.is_success:
-                yield LiveViewResult(
-                    success=False,
-                    message=validation_result.error,
-                    image_data=None,
-                    image_format=None,
-                )
-                return
+            logger.info("Executing start live view stream use case")
 
-            # Create live view stream configuration with parameters
-            config = LiveViewStream(
-                framerate=request.framerate, quality=request.quality
-            )
-
-            # Start live view stream
+            # The request validated and built its configuration when created
             async for result in self.camera_control_service.start_live_view_stream(
-                config
+                request.stream_config
             ):
                 yield result
 
         except Exception as e:
-            self.logger.error(f"Error in start live view stream use case: {e}")
+            logger.error(
+                f"Error in start live view stream use case: {e}",
+                exc_info=not isinstance(e, CAMERA_ERRORS),
+            )
             # Yield error result
             yield LiveViewResult(
                 success=False,
-                message=f"Error starting live view stream: {str(e)}",
-                image_data=None,
-                image_format=None,
+                message=f"Error starting live view stream: {e}",
             )
 
 
@@ -276,52 +325,26 @@ class ManualShootingUseCase:
 
     def __init__(self, camera_control_service: CameraControlService):
         self.camera_control_service = camera_control_service
-        self.logger = logging.getLogger(__name__)
-
-    def _validate_request(self, request: ManualShootingRequest) -> Result[None]:
-        """Validate manual shooting request."""
-        if request.shots <= 0:
-            return Result.failure("Number of shots must be greater than 0")
-
-        if request.interval < 0:
-            return Result.failure("Interval must be non-negative")
-
-        if request.iso <= 0:
-            return Result.failure("ISO value must be greater than 0")
-
-        if request.subject_distance <= 0:
-            return Result.failure("Subject distance must be greater than 0")
-
-        if not request.speed:
-            return Result.failure("Speed parameter cannot be empty")
-
-        return Result.success(None)
 
     async def execute(self, request: ManualShootingRequest) -> ManualShootingResponse:
         """Execute the manual shooting use case."""
         try:
-            self.logger.info(
-                f"Executing manual shooting use case: {request.shots} shots"
-            )
-
-            # Validate request
-            validation_result = self._validate_request(request)
-            if not validation_result.is_success:
-                return ManualShootingResponse(
-                    success=False,
-                    message=validation_result.error,
-                    images_captured=0,
-                    image_paths=[],
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Executing manual shooting use case: {request.shots} shots"
                 )
 
-            # Create parameters
-            parameters = ManualShootingParameters(
-                subject_distance=request.subject_distance,
-                speed=request.speed,
-                iso=request.iso,
-                shots=request.shots,
-                interval=request.interval,
-            )
+            # Create parameters, which validate themselves
+            try:
+                parameters = ManualShootingParameters(
+                    subject_distance=request.subject_distance,
+                    speed=request.speed,
+                    iso=request.iso,
+                    shots=request.shots,
+                    interval=request.interval,
+                )
+            except ValueError as e:
+                return ManualShootingResponse(success=False, message=str(e))
 
             # Execute manual shooting
             result = await self.camera_control_service.manual_shoot(parameters)
@@ -335,10 +358,13 @@ class ManualShootingUseCase:
             )
 
         except Exception as e:
-            self.logger.error(f"Error in manual shooting use case: {e}")
+            logger.error(
+                f"Error in manual shooting use case: {e}",
+                exc_info=not isinstance(e, CAMERA_ERRORS),
+            )
             return ManualShootingResponse(
                 success=False,
-                message=f"Error in manual shooting: {str(e)}",
+                message=f"Error in manual shooting: {e}",
                 images_captured=0,
-                image_paths=[],
+                image_paths=(),
             )
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, Generic, TypeVar, Dict, Any
-from enum import Enum
-from pathlib import Path
+from datetime import date, datetime
+from typing import Optional, Generic, TypeVar, Dict, Any, Tuple, Union
+from enum import Enum, StrEnum
+import os
 
 
 class ResultType(Enum):
@@ -15,7 +15,7 @@ class ResultType(Enum):
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Result(Generic[T]):
     """Generic result pattern for operations."""
 
@@ -35,8 +35,16 @@ class Result(Generic[T]):
         return cls(is_success=False, error=error, timestamp=datetime.now())
 
 
-class ErrorType(Enum):
-    """Error type enumeration for categorizing errors."""
+# Shared result for successful validations. Result is frozen, so one instance
+# can be returned every time; it carries no timestamp by design.
+_SUCCESS_NONE: Result[None] = Result(is_success=True)
+
+
+class ErrorType(StrEnum):
+    """Error type enumeration for categorizing errors.
+
+    Members are strings, so they serialize and compare as their values.
+    """
 
     VALIDATION_ERROR = "validation_error"
     CONFIGURATION_ERROR = "configuration_error"
@@ -60,7 +68,7 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ErrorDetails:
     """Detailed error information."""
 
@@ -73,15 +81,15 @@ class ErrorDetails:
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now()
+            object.__setattr__(self, "timestamp", datetime.now())
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ErrorResponse:
     """Standardized error response for API endpoints."""
 
     success: bool = False
-    error_type: str = "unknown_error"
+    error_type: ErrorType = ErrorType.UNKNOWN_ERROR
     message: str = "An unexpected error occurred"
     code: Optional[str] = None
     details: Optional[Dict[str, Any]] = None
@@ -91,7 +99,7 @@ class ErrorResponse:
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now()
+            object.__setattr__(self, "timestamp", datetime.now())
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the error response to a dictionary for JSON serialization."""
@@ -209,7 +217,20 @@ class ResourceError(CameraControlError):
         super().__init__(message, ErrorType.RESOURCE_ERROR, code, details)
 
 
-@dataclass
+def format_date_stamp(moment: date) -> str:
+    """Format a date or datetime as YYYYMMDD without going through strftime."""
+    return f"{moment.year:04d}{moment.month:02d}{moment.day:02d}"
+
+
+def build_shooting_id(prefix: str, now: datetime) -> str:
+    """Build a shooting ID such as shooting_20250628_064754."""
+    return (
+        f"{prefix}_{format_date_stamp(now)}"
+        f"_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class CameraShootingResult:
     """Domain entity for camera shooting results."""
 
@@ -220,16 +241,41 @@ class CameraShootingResult:
     timestamp: datetime = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class ShootParams:
+    """Parameters for a single shot command (it takes none)."""
+
+
+@dataclass(slots=True, frozen=True)
+class AutoShootParams:
+    """Parameters for an automatic shooting command."""
+
+    shots: int = 1
+    interval: float = 1.0  # seconds between shots
+    delay: float = 0  # seconds before the first shot
+
+
+@dataclass(slots=True, frozen=True)
+class BurstShootParams:
+    """Parameters for a burst shooting command."""
+
+    shots: int = 3
+    burst_interval: float = 0.5  # seconds between shots
+
+
+CameraCommandParameters = Union[ShootParams, AutoShootParams, BurstShootParams]
+
+
+@dataclass(slots=True, frozen=True)
 class CameraCommand:
     """Domain entity for camera commands."""
 
-    command_type: str  # "shoot", "auto_shoot", "burst_shoot", etc.
-    parameters: dict
+    command_type: str  # "shoot", "auto_shoot" or "burst_shoot"
+    parameters: CameraCommandParameters
     timestamp: datetime = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CameraStatus:
     """Domain entity for camera status."""
 
@@ -240,7 +286,7 @@ class CameraStatus:
     storage_available: Optional[int] = None  # in MB
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LiveViewResult:
     """Domain entity for live view results."""
 
@@ -251,7 +297,7 @@ class LiveViewResult:
     timestamp: datetime = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LiveViewStream:
     """Domain entity for live view stream configuration."""
 
@@ -259,7 +305,7 @@ class LiveViewStream:
     quality: int = 80  # JPEG quality (1-100), default 80
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CameraConfiguration:
     """Domain entity for camera configuration."""
 
@@ -269,6 +315,8 @@ class CameraConfiguration:
     default_jpeg_quality: int = 80
     max_framerate: float = 8.0
     command_timeout: int = 30  # seconds
+    persistent_session: bool = False  # reuse one interactive chdkptp process
+    use_sudo: bool = True  # disable once chdkptp can open the USB device itself
 
     # Validation ranges
     MIN_JPEG_QUALITY: int = 1
@@ -282,15 +330,13 @@ class CameraConfiguration:
         """Validate configuration values."""
         try:
             # Validate paths
-            if not Path(self.chdkptp_location).exists():
+            if not os.path.exists(self.chdkptp_location):
                 return Result.failure(
                     f"CHDKPTP location does not exist: {self.chdkptp_location}"
                 )
 
             # Validate output directory (create if doesn't exist)
-            output_path = Path(self.output_directory)
-            if not output_path.exists():
-                output_path.mkdir(parents=True, exist_ok=True)
+            os.makedirs(self.output_directory, exist_ok=True)
 
             # Validate JPEG quality
             if not (
@@ -314,13 +360,13 @@ class CameraConfiguration:
                     f"Command timeout must be between {self.MIN_TIMEOUT} and {self.MAX_TIMEOUT} seconds"
                 )
 
-            return Result.success(None)
+            return _SUCCESS_NONE
 
         except Exception as e:
             return Result.failure(f"Configuration validation error: {str(e)}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageProcessingConfiguration:
     """Domain entity for image processing configuration."""
 
@@ -370,21 +416,20 @@ class ImageProcessingConfiguration:
                 )
 
             # Validate colors (RGB values 0-255)
-            for color_name, color_value in [
+            for color_name, color_value in (
                 ("timestamp_color", self.timestamp_color),
                 ("timestamp_outline_color", self.timestamp_outline_color),
-            ]:
+            ):
                 if len(color_value) != 3:
                     return Result.failure(
                         f"{color_name} must have exactly 3 RGB values"
                     )
-                for i, component in enumerate(color_value):
-                    if not (0 <= component <= 255):
-                        return Result.failure(
-                            f"{color_name} component {i} must be between 0 and 255"
-                        )
+                if min(color_value) < 0 or max(color_value) > 255:
+                    return Result.failure(
+                        f"{color_name} components must be between 0 and 255"
+                    )
 
-            return Result.success(None)
+            return _SUCCESS_NONE
 
         except Exception as e:
             return Result.failure(
@@ -392,7 +437,12 @@ class ImageProcessingConfiguration:
             )
 
 
-@dataclass
+# Allowed values, in the order they are listed in validation messages
+VALID_ENVIRONMENTS = ("development", "staging", "production")
+VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+@dataclass(slots=True, frozen=True)
 class EnvironmentConfiguration:
     """Environment-specific configuration."""
 
@@ -422,16 +472,16 @@ class EnvironmentConfiguration:
         """Validate environment configuration."""
         try:
             # Validate environment
-            valid_environments = ["development", "staging", "production"]
-            if self.environment not in valid_environments:
+            if self.environment not in VALID_ENVIRONMENTS:
                 return Result.failure(
-                    f"Environment must be one of: {valid_environments}"
+                    f"Environment must be one of: {list(VALID_ENVIRONMENTS)}"
                 )
 
             # Validate log level
-            valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-            if self.log_level.upper() not in valid_log_levels:
-                return Result.failure(f"Log level must be one of: {valid_log_levels}")
+            if self.log_level.upper() not in VALID_LOG_LEVELS:
+                return Result.failure(
+                    f"Log level must be one of: {list(VALID_LOG_LEVELS)}"
+                )
 
             # Validate concurrent streams
             if not (
@@ -451,7 +501,7 @@ class EnvironmentConfiguration:
                     f"Stream buffer size must be between {self.MIN_BUFFER_SIZE} and {self.MAX_BUFFER_SIZE} bytes"
                 )
 
-            return Result.success(None)
+            return _SUCCESS_NONE
 
         except Exception as e:
             return Result.failure(
@@ -459,7 +509,7 @@ class EnvironmentConfiguration:
             )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApplicationConfiguration:
     """Complete application configuration."""
 
@@ -483,7 +533,7 @@ class ApplicationConfiguration:
             if not env_result.is_success:
                 return env_result
 
-            return Result.success(None)
+            return _SUCCESS_NONE
 
         except Exception as e:
             return Result.failure(
@@ -491,7 +541,7 @@ class ApplicationConfiguration:
             )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ManualShootingParameters:
     """Domain entity for manual shooting parameters."""
 
@@ -515,7 +565,7 @@ class ManualShootingParameters:
             raise ValueError("Speed parameter cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ManualShootingResult:
     """Domain entity for manual shooting results."""
 
@@ -523,11 +573,11 @@ class ManualShootingResult:
     message: str
     shooting_id: Optional[str] = None
     images_captured: int = 0
-    image_paths: list[str] = None
+    image_paths: Tuple[str, ...] = ()
     timestamp: datetime = None
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now()
-        if self.image_paths is None:
-            self.image_paths = []
+            object.__setattr__(self, "timestamp", datetime.now())
+        if not isinstance(self.image_paths, tuple):
+            object.__setattr__(self, "image_paths", tuple(self.image_paths or ()))
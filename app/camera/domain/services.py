@@ -49,6 +49,11 @@ class CameraControlService(ABC):
         """Stop the live view stream."""
         pass
 
+    @abstractmethod
+    async def is_camera_connected(self) -> bool:
+        """Check whether the camera can be reached."""
+        pass
+
 
 class ImageProcessingService(ABC):
     """Abstract image processing service."""
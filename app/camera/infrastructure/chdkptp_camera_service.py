@@ -1,20 +1,43 @@
 import asyncio
+import heapq
 import logging
 import os
+import shlex
 import subprocess
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import Optional, AsyncGenerator
+from typing import AbstractSet, AsyncGenerator, List, NamedTuple, Optional, Set
 from datetime import datetime
 
 from ..domain.entities import (
+    AutoShootParams,
+    BurstShootParams,
     CameraShootingResult,
     CameraCommand,
     LiveViewResult,
     LiveViewStream,
+    build_shooting_id,
 )
 from ..domain.services import CameraControlService
+from .file_management_service import IMAGE_EXTENSIONS
+from .subprocess_service import quote_chdkptp_argument
+
+
+class CommandResult(NamedTuple):
+    """Outcome of a chdkptp run, decoding its output only when it is read."""
+
+    returncode: int
+    stdout_data: bytes
+    stderr_data: bytes
+
+    @property
+    def stdout(self) -> str:
+        return self.stdout_data.decode(errors="replace")
+
+    @property
+    def stderr(self) -> str:
+        return self.stderr_data.decode(errors="replace")
 
 
 class CHDKPTPCameraService(CameraControlService):
@@ -24,12 +47,25 @@ class CHDKPTPCameraService(CameraControlService):
         self,
         chdkptp_location: str = ("/home/arrumada/Dev/CanonCameraControl/ChdkPTP"),
         output_directory: str = "/home/arrumada/Images",
+        use_sudo: bool = True,
     ):
         self.chdkptp_location = Path(chdkptp_location)
         self.output_directory = Path(output_directory)
+        self._rs_destination = quote_chdkptp_argument(output_directory)
         self.logger = logging.getLogger(__name__)
         self._streaming = False
         self._frame_path = self.chdkptp_location / "frame.ppm"
+        self._chdkptp_script = str(self.chdkptp_location / "chdkptp.sh")
+        self._chdkptp_script_found = False
+        self._command_prefix = (
+            ["sudo", self._chdkptp_script] if use_sudo else [self._chdkptp_script]
+        )
+
+    def _chdkptp_script_exists(self) -> bool:
+        """Check for the CHDKPTP script, remembering it once it has been found."""
+        if not self._chdkptp_script_found:
+            self._chdkptp_script_found = os.path.isfile(self._chdkptp_script)
+        return self._chdkptp_script_found
 
     async def shoot_camera(self) -> CameraShootingResult:
         """Shoot camera and return the result with image path."""
@@ -37,10 +73,8 @@ class CHDKPTPCameraService(CameraControlService):
             self.logger.info("Starting camera shooting")
 
             # Build CHDKPTP command using the simpler format
-            chdkptp_script = self.chdkptp_location / "chdkptp.sh"
-
-            if not chdkptp_script.exists():
-                self.logger.error(f"CHDKPTP script not found: {chdkptp_script}")
+            if not self._chdkptp_script_exists():
+                self.logger.error(f"CHDKPTP script not found: {self._chdkptp_script}")
                 return CameraShootingResult(
                     success=False,
                     message="CHDKPTP script not found",
@@ -52,16 +86,18 @@ class CHDKPTPCameraService(CameraControlService):
             # Use the simpler command format: connect, rec, rs, play,
             # disconnect
             cmd = [
-                "sudo",
-                str(chdkptp_script),
+                *self._command_prefix,
                 "-ec",  # connect
                 "-erec",  # switch to record mode
-                f"-ers {self.output_directory}",  # remote shoot
+                f"-ers {self._rs_destination}",  # remote shoot
                 "-eplay",  # switch to play mode
                 "-edisconnect",  # disconnect
             ]
 
-            self.logger.info(f"Executing camera shooting command: {' '.join(cmd)}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Executing camera shooting command: {shlex.join(cmd)}"
+                )
 
             result = await self._run_chdkptp_command(cmd)
 
@@ -70,7 +106,8 @@ class CHDKPTPCameraService(CameraControlService):
 
                 # Get the latest image from the output directory
                 image_path = self._get_latest_image()
-                shooting_id = f"shooting_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                now = datetime.now()
+                shooting_id = build_shooting_id("shooting", now)
 
                 self.logger.info(f"shoot_camera, image_path: {image_path}")
 
@@ -79,7 +116,7 @@ class CHDKPTPCameraService(CameraControlService):
                     message="Camera shooting completed",
                     shooting_id=shooting_id,
                     image_path=image_path,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                 )
             else:
                 self.logger.error(f"Camera shooting failed: {result.stderr}")
@@ -296,6 +333,15 @@ class CHDKPTPCameraService(CameraControlService):
         self._streaming = False
         self.logger.info("🎥 Live view stream stop requested")
 
+    async def is_camera_connected(self) -> bool:
+        """Check whether the camera can be reached."""
+        try:
+            result = await self._run_chdkptp_command(["-c", "-elua return true"])
+        except Exception as e:
+            self.logger.info(f"Camera connection check failed: {e}")
+            return False
+        return result.returncode == 0
+
     async def _read_ppm_image(self) -> Optional[np.ndarray]:
         """Read a PPM image from the frame file."""
         try:
@@ -356,13 +402,15 @@ class CHDKPTPCameraService(CameraControlService):
             self.logger.error(f"Error converting to JPEG: {e}")
             raise
 
-    async def _execute_auto_shoot(self, parameters: dict) -> CameraShootingResult:
+    async def _execute_auto_shoot(
+        self, parameters: AutoShootParams
+    ) -> CameraShootingResult:
         """Execute automatic shooting with parameters."""
         try:
             # Extract parameters with defaults
-            shots = parameters.get("shots", 1)
-            interval = parameters.get("interval", 1.0)  # seconds
-            delay = parameters.get("delay", 0)  # seconds before first shot
+            shots = parameters.shots
+            interval = parameters.interval
+            delay = parameters.delay
 
             self.logger.info(
                 f"Auto shoot: {shots} shots, {interval}s interval, {delay}s delay"
@@ -373,22 +421,12 @@ class CHDKPTPCameraService(CameraControlService):
                 self.logger.info(f"Waiting {delay} seconds before shooting...")
                 await asyncio.sleep(delay)
 
-            # Take shots
-            image_paths = []
-            for i in range(shots):
-                self.logger.info(f"Taking shot {i + 1}/{shots}")
-
-                result = await self.shoot_camera()
-                if result.success and result.image_path:
-                    image_paths.append(result.image_path)
-
-                # Wait between shots (except for the last shot)
-                if i < shots - 1:
-                    await asyncio.sleep(interval)
+            image_paths = await self._shoot_series(shots, interval)
 
             # Return the last image path
             final_image_path = image_paths[-1] if image_paths else None
-            shooting_id = f"auto_shoot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            now = datetime.now()
+            shooting_id = build_shooting_id("auto_shoot", now)
 
             return CameraShootingResult(
                 success=len(image_paths) > 0,
@@ -397,7 +435,7 @@ class CHDKPTPCameraService(CameraControlService):
                 ),
                 shooting_id=shooting_id,
                 image_path=final_image_path,
-                timestamp=datetime.now(),
+                timestamp=now,
             )
 
         except Exception as e:
@@ -410,31 +448,23 @@ class CHDKPTPCameraService(CameraControlService):
                 timestamp=datetime.now(),
             )
 
-    async def _execute_burst_shoot(self, parameters: dict) -> CameraShootingResult:
+    async def _execute_burst_shoot(
+        self, parameters: BurstShootParams
+    ) -> CameraShootingResult:
         """Execute burst shooting (rapid fire)."""
         try:
             # Extract parameters with defaults
-            shots = parameters.get("shots", 3)
-            burst_interval = parameters.get("burst_interval", 0.5)  # seconds
+            shots = parameters.shots
+            burst_interval = parameters.burst_interval
 
             self.logger.info(f"Burst shoot: {shots} shots, {burst_interval}s interval")
 
-            # Take rapid shots
-            image_paths = []
-            for i in range(shots):
-                self.logger.info(f"Burst shot {i + 1}/{shots}")
-
-                result = await self.shoot_camera()
-                if result.success and result.image_path:
-                    image_paths.append(result.image_path)
-
-                # Short wait between burst shots
-                if i < shots - 1:
-                    await asyncio.sleep(burst_interval)
+            image_paths = await self._shoot_series(shots, burst_interval)
 
             # Return the last image path
             final_image_path = image_paths[-1] if image_paths else None
-            shooting_id = f"burst_shoot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            now = datetime.now()
+            shooting_id = build_shooting_id("burst_shoot", now)
 
             return CameraShootingResult(
                 success=len(image_paths) > 0,
@@ -443,7 +473,7 @@ class CHDKPTPCameraService(CameraControlService):
                 ),
                 shooting_id=shooting_id,
                 image_path=final_image_path,
-                timestamp=datetime.now(),
+                timestamp=now,
             )
 
         except Exception as e:
@@ -456,166 +486,155 @@ class CHDKPTPCameraService(CameraControlService):
                 timestamp=datetime.now(),
             )
 
-    def _get_latest_image(self) -> Optional[str]:
-        """Get the latest image from the output directory."""
-        try:
-            self.logger.info(
-                f"🔍 _get_latest_image: checking directory {self.output_directory}"
-            )
+    async def _shoot_series(self, shots: int, interval: float) -> List[str]:
+        """Take a series of shots in one chdkptp run and return their image paths.
 
-            # Look for common image extensions
-            image_extensions = [".jpg", ".jpeg", ".cr2", ".raw"]
-            image_paths = []
+        chdkptp paces the shots itself, so the camera is connected and switched
+        to record mode once per series instead of once per shot.
+        """
+        # Only images that appear during this run belong to the series
+        existing_images = self._get_image_paths()
 
-            # Get all files in the output directory
-            if self.output_directory.exists():
-                self.logger.info(f"🔍 Output directory exists: {self.output_directory}")
+        cmd = [
+            "-ec",  # connect
+            "-erec",  # switch to record mode
+            f"-ers {self._rs_destination} "
+            f"-shots={shots} "
+            f"-int={interval}",  # remote shoot series
+            "-eplay",  # switch to play mode
+            "-edisconnect",  # disconnect
+        ]
 
-                # List all files in directory for debugging
-                all_files = list(self.output_directory.iterdir())
-                self.logger.info(
-                    f"🔍 All files in directory: {[f.name for f in all_files]}"
-                )
+        result = await self._run_chdkptp_command(cmd)
+        if result.returncode != 0:
+            self.logger.error(f"Shooting series failed: {result.stderr}")
+            return []
 
-                for ext in image_extensions:
-                    found_files = list(self.output_directory.glob(f"*{ext}"))
-                    self.logger.info(
-                        f"🔍 Found {len(found_files)} files with extension {ext}: {[f.name for f in found_files]}"
-                    )
-                    image_paths.extend([str(f) for f in found_files])
+        return self._get_latest_images(shots, exclude=existing_images)
 
-                self.logger.info(f"🔍 Total image files found: {len(image_paths)}")
+    def _get_latest_image(self) -> Optional[str]:
+        """Get the latest image from the output directory."""
+        latest_images = self._get_latest_images(1)
+        return latest_images[0] if latest_images else None
 
-                if image_paths:
-                    # Sort by modification time (newest first) and return the
-                    # latest
-                    image_paths.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+    def _get_image_paths(self) -> Set[str]:
+        """Get the paths of all images in the output directory."""
+        try:
+            with os.scandir(self.output_directory) as entries:
+                return {
+                    entry.path
+                    for entry in entries
+                    if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                    and entry.is_file()
+                }
+        except FileNotFoundError:
+            return set()
+
+    def _get_latest_images(
+        self, count: int, exclude: AbstractSet[str] = frozenset()
+    ) -> List[str]:
+        """Get the newest images from the output directory, oldest first.
+
+        Images whose paths are in exclude are skipped.
+        """
+        try:
+            # Single pass over the directory, keeping only the newest images
+            images = []
+            with os.scandir(self.output_directory) as entries:
+                for entry in entries:
+                    extension = os.path.splitext(entry.name)[1].lower()
+                    if extension not in IMAGE_EXTENSIONS or not entry.is_file():
+                        continue
+                    if entry.path in exclude:
+                        continue
+                    images.append((entry.stat().st_mtime, entry.path))
 
-                    # Log the top 5 most recent images
-                    self.logger.info("🔍 Top 5 most recent images:")
-                    for i, path in enumerate(image_paths[:5]):
-                        mtime = os.path.getmtime(path)
-                        self.logger.info(
-                            f"🔍   {i + 1}. {path} (modified: {datetime.fromtimestamp(mtime)})"
-                        )
+            if not images:
+                self.logger.warning("🔍 No image files found in output directory")
+                return []
 
-                    latest = image_paths[0]
-                    self.logger.info(f"🔍 Returning latest image: {latest}")
-                    return latest
-                else:
-                    self.logger.warning("🔍 No image files found in output directory")
-                    return None
-            else:
-                self.logger.error(
-                    f"🔍 Output directory does not exist: {self.output_directory}"
-                )
-                return None
+            latest_images = heapq.nlargest(count, images)
+            return [path for _, path in reversed(latest_images)]
 
+        except FileNotFoundError:
+            self.logger.error(
+                f"🔍 Output directory does not exist: {self.output_directory}"
+            )
+            return []
         except Exception as e:
             self.logger.error(f"Error getting latest image: {e}")
-            return None
+            return []
 
-    async def _run_chdkptp_command(self, cmd: list) -> subprocess.CompletedProcess:
+    async def _run_chdkptp_command(self, cmd: list) -> CommandResult:
         """Run CHDKPTP command asynchronously."""
-        self.logger.info(f"🔧 _run_chdkptp_command called with: {cmd}")
-        self.logger.info(f"🔧 Current working directory: {os.getcwd()}")
-        self.logger.info(f"🔧 CHDKPTP location: {self.chdkptp_location}")
-
-        # Change to CHDKPTP directory
-        original_cwd = os.getcwd()
-        os.chdir(self.chdkptp_location)
-        self.logger.info(f"🔧 Changed to directory: {os.getcwd()}")
-
         try:
             # Check if this is a full command or just arguments
-            if len(cmd) > 0 and not cmd[0].startswith("sudo"):
+            if len(cmd) > 0 and cmd[0] not in ("sudo", self._chdkptp_script):
                 # This is just arguments, need to build the full command
-                chdkptp_script = (
-                    self.chdkptp_location / "chdkptp.sh"
-                )  # Use absolute path
-                self.logger.info(f"🔧 Looking for script at: {chdkptp_script}")
-
-                if not chdkptp_script.exists():
+                if not self._chdkptp_script_exists():
                     self.logger.error(
-                        f"🔧 CHDKPTP script not found at: {chdkptp_script}"
+                        f"🔧 CHDKPTP script not found at: {self._chdkptp_script}"
                     )
                     raise FileNotFoundError(
-                        f"CHDKPTP script not found: {chdkptp_script}"
+                        f"CHDKPTP script not found: {self._chdkptp_script}"
                     )
 
-                full_cmd = ["sudo", str(chdkptp_script)] + cmd
-                self.logger.info(f"🔧 Built full command: {full_cmd}")
+                full_cmd = self._command_prefix + cmd
             else:
                 # This is already a full command
                 full_cmd = cmd
-                self.logger.info(f"🔧 Using existing full command: {full_cmd}")
 
-            self.logger.info(f"🔧 Final command to execute: {full_cmd}")
-            self.logger.info(f"🔧 Working directory for execution: {os.getcwd()}")
+            self.logger.debug("🔧 Running CHDKPTP command: %s", full_cmd)
 
-            # Run the command
+            # Run the command in the CHDKPTP directory without changing the
+            # process-wide cwd
             process = await asyncio.create_subprocess_exec(
                 *full_cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.chdkptp_location),
             )
 
             stdout, stderr = await process.communicate()
 
-            self.logger.info(
-                f"🔧 Command completed with return code: {process.returncode}"
-            )
-            if stdout:
-                self.logger.info(f"🔧 stdout: {stdout.decode()}")
-            if stderr:
-                self.logger.info(f"🔧 stderr: {stderr.decode()}")
-
-            return subprocess.CompletedProcess(
-                args=full_cmd,
-                returncode=process.returncode,
-                stdout=stdout.decode() if stdout else "",
-                stderr=stderr.decode() if stderr else "",
+            self.logger.debug(
+                "🔧 Command exited with %s, stdout: %r, stderr: %r",
+                process.returncode,
+                stdout,
+                stderr,
             )
+
+            return CommandResult(process.returncode, stdout, stderr)
         except Exception as e:
             self.logger.error(f"🔧 Exception in _run_chdkptp_command: {e}")
             raise
-        finally:
-            # Restore original directory
-            os.chdir(original_cwd)
-            self.logger.info(f"🔧 Restored directory to: {os.getcwd()}")
 
     async def _validate_chdkptp_setup(
         self,
-    ) -> tuple[bool, str, Optional[Path], Optional[str]]:
+    ) -> tuple[bool, str, Optional[str], Optional[str]]:
         """Validate CHDKPTP setup and return paths if valid."""
-        chdkptp_script = self.chdkptp_location / "chdkptp.sh"
-        chdkptp_dir = str(self.chdkptp_location)
-
-        if not chdkptp_script.exists():
-            error_msg = f"CHDKPTP script not found: {chdkptp_script}"
-            self.logger.error(f"📸 {error_msg}")
-            return False, error_msg, None, None
-
-        if not Path(chdkptp_dir).exists():
-            error_msg = f"CHDKPTP directory not found: {chdkptp_dir}"
+        # The script lives in the CHDKPTP directory, so finding it also
+        # proves the directory exists
+        if not self._chdkptp_script_exists():
+            error_msg = f"CHDKPTP script not found: {self._chdkptp_script}"
             self.logger.error(f"📸 {error_msg}")
             return False, error_msg, None, None
 
-        return True, "", chdkptp_script, chdkptp_dir
+        return True, "", self._chdkptp_script, str(self.chdkptp_location)
 
     async def _execute_live_view_command(
-        self, chdkptp_script: Path, chdkptp_dir: str
-    ) -> tuple[bool, Optional[subprocess.CompletedProcess], str]:
+        self, chdkptp_script: str, chdkptp_dir: str
+    ) -> tuple[bool, Optional[CommandResult], str]:
         """Execute the live view command and return success status, result, and error message."""
         cmd = [
-            "sudo",
-            str(chdkptp_script),
+            *self._command_prefix,
             "-c",  # connect
             "-erec",  # switch to record mode
             "-elvdumpimg -vp=frame.ppm -count=1",  # live view dump
         ]
 
-        self.logger.info(f"📸 Executing command: {' '.join(cmd)}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"📸 Executing command: {shlex.join(cmd)}")
 
         try:
             result = await self._run_chdkptp_command(cmd)
@@ -623,9 +642,9 @@ class CHDKPTPCameraService(CameraControlService):
                 f"📸 Command completed with return code: {result.returncode}"
             )
 
-            if result.stdout:
+            if result.stdout_data:
                 self.logger.info(f"📸 Command stdout: {result.stdout}")
-            if result.stderr:
+            if result.stderr_data:
                 self.logger.info(f"📸 Command stderr: {result.stderr}")
 
             if result.returncode == 0:
@@ -693,7 +712,7 @@ class CHDKPTPCameraService(CameraControlService):
     def _add_timestamp_overlay(self, image: np.ndarray) -> np.ndarray:
         """Add timestamp overlay to the image."""
         now = datetime.now()
-        timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # trim to ms
+        timestamp_str = now.isoformat(sep=" ", timespec="milliseconds")
         font = cv2.FONT_HERSHEY_SIMPLEX
         font_scale = 0.7
         font_thickness = 2
@@ -21,6 +21,7 @@ class ConfigurationService:
         self.config_file_path = config_file_path
         self.logger = logging.getLogger(__name__)
         self._config: Optional[ApplicationConfiguration] = None
+        self._config_dict: Optional[Dict[str, Any]] = None
 
     def _get_env_var(self, key: str, default: Any = None) -> Any:
         """Get environment variable with type conversion."""
@@ -104,6 +105,14 @@ class ConfigurationService:
                 "CAMERA_COMMAND_TIMEOUT",
                 file_config.get("camera", {}).get("command_timeout", 30),
             ),
+            persistent_session=self._get_env_var(
+                "CAMERA_PERSISTENT_SESSION",
+                file_config.get("camera", {}).get("persistent_session", False),
+            ),
+            use_sudo=self._get_env_var(
+                "CAMERA_USE_SUDO",
+                file_config.get("camera", {}).get("use_sudo", True),
+            ),
         )
 
     def _get_image_processing_config(
@@ -208,6 +217,7 @@ class ConfigurationService:
                 return validation_result
 
             self._config = config
+            self._config_dict = None
             self.logger.info("Configuration loaded and validated successfully")
 
             return Result.success(config)
@@ -229,35 +239,15 @@ class ConfigurationService:
                 return None
         return self._config
 
-    def get_camera_config(self) -> Optional[CameraConfiguration]:
-        """Get camera configuration."""
-        config = self.configuration
-        return config.camera if config else None
-
-    def get_image_processing_config(self) -> Optional[ImageProcessingConfiguration]:
-        """Get image processing configuration."""
-        config = self.configuration
-        return config.image_processing if config else None
-
-    def get_environment_config(self) -> Optional[EnvironmentConfiguration]:
-        """Get environment configuration."""
+    @property
+    def configuration_dict(self) -> Optional[Dict[str, Any]]:
+        """Get the current configuration as a dictionary, built once per load."""
         config = self.configuration
-        return config.environment if config else None
-
-    def reload_configuration(self) -> Result[ApplicationConfiguration]:
-        """Reload configuration from sources."""
-        self._config = None
-        return self.load_configuration()
-
-    def export_configuration(self, file_path: str) -> Result[None]:
-        """Export current configuration to file."""
-        try:
-            config = self.configuration
-            if not config:
-                return Result.failure("No configuration to export")
+        if not config:
+            return None
 
-            # Convert configuration to dictionary
-            config_dict = {
+        if self._config_dict is None:
+            self._config_dict = {
                 "camera": {
                     "chdkptp_location": config.camera.chdkptp_location,
                     "output_directory": config.camera.output_directory,
@@ -265,6 +255,8 @@ class ConfigurationService:
                     "default_jpeg_quality": config.camera.default_jpeg_quality,
                     "max_framerate": config.camera.max_framerate,
                     "command_timeout": config.camera.command_timeout,
+                    "persistent_session": config.camera.persistent_session,
+                    "use_sudo": config.camera.use_sudo,
                 },
                 "image_processing": {
                     "default_jpeg_quality": config.image_processing.default_jpeg_quality,
@@ -284,6 +276,37 @@ class ConfigurationService:
                     "stream_buffer_size": config.environment.stream_buffer_size,
                 },
             }
+        return self._config_dict
+
+    def get_camera_config(self) -> Optional[CameraConfiguration]:
+        """Get camera configuration."""
+        config = self.configuration
+        return config.camera if config else None
+
+    def get_image_processing_config(self) -> Optional[ImageProcessingConfiguration]:
+        """Get image processing configuration."""
+        config = self.configuration
+        return config.image_processing if config else None
+
+    def get_environment_config(self) -> Optional[EnvironmentConfiguration]:
+        """Get environment configuration."""
+        config = self.configuration
+        return config.environment if config else None
+
+    def reload_configuration(self) -> Result[ApplicationConfiguration]:
+        """Reload configuration from sources."""
+        self._config = None
+        self._config_dict = None
+        return self.load_configuration()
+
+    def export_configuration(self, file_path: str) -> Result[None]:
+        """Export current configuration to file."""
+        try:
+            config = self.configuration
+            if not config:
+                return Result.failure("No configuration to export")
+
+            config_dict = self.configuration_dict
 
             # Write to file
             with open(file_path, "w") as f:
@@ -1,11 +1,22 @@
+import asyncio
 import logging
-from typing import Optional
-
-from ..domain.entities import CameraConfiguration, ImageProcessingConfiguration
+from typing import AsyncGenerator, Coroutine, Optional, Set
+
+from ..application.use_cases import (
+    StartLiveViewStreamRequest,
+    StartLiveViewStreamUseCase,
+    TakeLiveViewSnapshotUseCase,
+)
+from ..domain.entities import (
+    CameraConfiguration,
+    ImageProcessingConfiguration,
+    LiveViewResult,
+)
 from ..domain.services import CameraControlService
 from .subprocess_service import CHDKPTPSubprocessService
 from .image_processing_service import OpenCVImageProcessingService
 from .file_management_service import LocalFileManagementService
+from .live_view_frame_hub import LiveViewFrameHub
 from .refactored_camera_service import RefactoredCHDKPTPCameraService
 from .configuration_service import get_configuration_service
 
@@ -25,6 +36,9 @@ class CameraContainer:
         self._image_service: Optional[OpenCVImageProcessingService] = None
         self._file_service: Optional[LocalFileManagementService] = None
         self._camera_service: Optional[RefactoredCHDKPTPCameraService] = None
+        self._live_view_hub: Optional[LiveViewFrameHub] = None
+        self._snapshot_use_case: Optional[TakeLiveViewSnapshotUseCase] = None
+        self._pending_closes: Set[asyncio.Task] = set()
 
     @property
     def configuration_service(self):
@@ -57,7 +71,10 @@ class CameraContainer:
 
             self.logger.info("🔧 Creating CHDKPTP subprocess service")
             self._subprocess_service = CHDKPTPSubprocessService(
-                camera_config.chdkptp_location
+                camera_config.chdkptp_location,
+                persistent_session=camera_config.persistent_session,
+                use_sudo=camera_config.use_sudo,
+                command_timeout=camera_config.command_timeout,
             )
         return self._subprocess_service
 
@@ -116,6 +133,83 @@ class CameraContainer:
             )
         return self._camera_service
 
+    @property
+    def snapshot_use_case(self) -> Optional[TakeLiveViewSnapshotUseCase]:
+        """Get or create the live view snapshot use case shared by all requests."""
+        if self._snapshot_use_case is None:
+            camera_service = self.camera_service
+            if not camera_service:
+                return None
+
+            self._snapshot_use_case = TakeLiveViewSnapshotUseCase(camera_service)
+        return self._snapshot_use_case
+
+    def live_view_frames(
+        self, framerate: float, quality: int
+    ) -> AsyncGenerator[LiveViewResult, None]:
+        """Get a client stream of live view frames.
+
+        The camera has one live view, so all clients share a single hub. The
+        client that starts its capture loop picks the stream configuration;
+        later clients get the running stream. Raises ValueError for an invalid
+        configuration.
+        """
+        request = StartLiveViewStreamRequest(framerate=framerate, quality=quality)
+        return self._live_view_frames(request)
+
+    async def _live_view_frames(
+        self, request: StartLiveViewStreamRequest
+    ) -> AsyncGenerator[LiveViewResult, None]:
+        """Subscribe to the shared live view hub, creating it if needed."""
+        hub = self._live_view_hub
+        if hub is None:
+            camera_service = self.camera_service
+            if not camera_service:
+                yield LiveViewResult(
+                    success=False, message="Camera service not available"
+                )
+                return
+
+            self.logger.info("🎥 Creating live view hub")
+            use_case = StartLiveViewStreamUseCase(camera_service)
+            hub = LiveViewFrameHub(
+                use_case.execute, on_idle=self._discard_live_view_hub
+            )
+            self._live_view_hub = hub
+
+        # Subscribing happens before the first await, so the hub cannot be
+        # discarded between lookup and subscription
+        async for result in hub.frames(request):
+            yield result
+
+    def _discard_live_view_hub(self, hub: LiveViewFrameHub) -> None:
+        """Forget a hub whose last client has left."""
+        if self._live_view_hub is hub:
+            self._live_view_hub = None
+
+    def _close_subprocess_session(self) -> None:
+        """Schedule shutdown of the interactive CHDKPTP process, if any."""
+        if self._subprocess_service:
+            self._schedule_close(self._subprocess_service.close())
+
+    def _stop_live_view_hub(self) -> None:
+        """Schedule shutdown of the live view capture loop, if any."""
+        hub, self._live_view_hub = self._live_view_hub, None
+        if hub:
+            self._schedule_close(hub.stop())
+
+    def _schedule_close(self, close: Coroutine) -> None:
+        """Run a shutdown coroutine on the running loop without waiting for it."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            close.close()
+            return
+
+        task = loop.create_task(close)
+        self._pending_closes.add(task)
+        task.add_done_callback(self._pending_closes.discard)
+
     def reload_configuration(self) -> bool:
         """Reload configuration and reset services."""
         try:
@@ -128,6 +222,9 @@ class CameraContainer:
                 return False
 
             # Reset services to force recreation with new config
+            self._stop_live_view_hub()
+            self._close_subprocess_session()
+            self._snapshot_use_case = None
             self._subprocess_service = None
             self._image_service = None
             self._file_service = None
@@ -180,11 +277,19 @@ class CameraContainer:
         """Clean up resources."""
         self.logger.info("🧹 Cleaning up camera container")
 
-        # Stop any active streams
+        # Stop any active stream
+        hub, self._live_view_hub = self._live_view_hub, None
+        if hub:
+            await hub.stop()
+
         if self._camera_service:
             await self._camera_service.stop_live_view_stream()
 
+        if self._subprocess_service:
+            await self._subprocess_service.close()
+
         # Reset services
+        self._snapshot_use_case = None
         self._subprocess_service = None
         self._image_service = None
         self._file_service = None
@@ -72,7 +72,7 @@ class ErrorHandlingService:
             self.logger.error(f"Error in error handler: {e}")
             return ErrorResponse(
                 success=False,
-                error_type=ErrorType.UNKNOWN_ERROR.value,
+                error_type=ErrorType.UNKNOWN_ERROR,
                 message="An unexpected error occurred while handling another error",
                 code="ERROR_HANDLER_FAILURE",
                 request_id=request_id,
@@ -158,7 +158,7 @@ class ErrorHandlingService:
         """Handle validation errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.VALIDATION_ERROR.value,
+            error_type=ErrorType.VALIDATION_ERROR,
             message=details.message,
             code=details.code or "VALIDATION_ERROR",
             details=details.details,
@@ -172,7 +172,7 @@ class ErrorHandlingService:
         """Handle configuration errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.CONFIGURATION_ERROR.value,
+            error_type=ErrorType.CONFIGURATION_ERROR,
             message=details.message,
             code=details.code or "CONFIGURATION_ERROR",
             details=details.details,
@@ -186,7 +186,7 @@ class ErrorHandlingService:
         """Handle camera-related errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.CAMERA_ERROR.value,
+            error_type=ErrorType.CAMERA_ERROR,
             message=details.message,
             code=details.code or "CAMERA_ERROR",
             details=details.details,
@@ -200,7 +200,7 @@ class ErrorHandlingService:
         """Handle CHDKPTP-related errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.CHDKPTP_ERROR.value,
+            error_type=ErrorType.CHDKPTP_ERROR,
             message=details.message,
             code=details.code or "CHDKPTP_ERROR",
             details=details.details,
@@ -214,7 +214,7 @@ class ErrorHandlingService:
         """Handle file operation errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.FILE_ERROR.value,
+            error_type=ErrorType.FILE_ERROR,
             message=details.message,
             code=details.code or "FILE_ERROR",
             details=details.details,
@@ -228,7 +228,7 @@ class ErrorHandlingService:
         """Handle network-related errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.NETWORK_ERROR.value,
+            error_type=ErrorType.NETWORK_ERROR,
             message=details.message,
             code=details.code or "NETWORK_ERROR",
             details=details.details,
@@ -242,7 +242,7 @@ class ErrorHandlingService:
         """Handle permission errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.PERMISSION_ERROR.value,
+            error_type=ErrorType.PERMISSION_ERROR,
             message=details.message,
             code=details.code or "PERMISSION_ERROR",
             details=details.details,
@@ -256,7 +256,7 @@ class ErrorHandlingService:
         """Handle timeout errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.TIMEOUT_ERROR.value,
+            error_type=ErrorType.TIMEOUT_ERROR,
             message=details.message,
             code=details.code or "TIMEOUT_ERROR",
             details=details.details,
@@ -270,7 +270,7 @@ class ErrorHandlingService:
         """Handle resource-related errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.RESOURCE_ERROR.value,
+            error_type=ErrorType.RESOURCE_ERROR,
             message=details.message,
             code=details.code or "RESOURCE_ERROR",
             details=details.details,
@@ -284,7 +284,7 @@ class ErrorHandlingService:
         """Handle application-related errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.APPLICATION_ERROR.value,
+            error_type=ErrorType.APPLICATION_ERROR,
             message=details.message,
             code=details.code or "APPLICATION_ERROR",
             details=details.details,
@@ -298,7 +298,7 @@ class ErrorHandlingService:
         """Handle unknown errors."""
         return ErrorResponse(
             success=False,
-            error_type=ErrorType.UNKNOWN_ERROR.value,
+            error_type=ErrorType.UNKNOWN_ERROR,
             message="An unexpected error occurred",
             code=details.code or "UNKNOWN_ERROR",
             details=details.details,
@@ -1,10 +1,21 @@
+import asyncio
+import heapq
 import logging
+import os
+import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 
 from ..domain.services import FileManagementService
 
+# Extensions of image files in the output directory, both the formats chdkptp
+# downloads from the camera and common processed formats
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".cr2", ".raw"})
+
+# Minimum age of a directory's last change before its listing is cached
+SCAN_CACHE_MIN_AGE_NS = 1_000_000_000
+
 
 class LocalFileManagementService(FileManagementService):
     """Local file system management service."""
@@ -12,34 +23,28 @@ class LocalFileManagementService(FileManagementService):
     def __init__(self, output_directory: str):
         self.output_directory = Path(output_directory)
         self.logger = logging.getLogger(__name__)
+        # directory -> (directory mtime in ns, image listing)
+        self._scan_cache: Dict[str, Tuple[int, List[Tuple[float, str]]]] = {}
 
     async def get_latest_image(self, directory: str) -> Optional[str]:
         """Get the latest image file from directory."""
         try:
-            dir_path = Path(directory)
-            if not dir_path.exists():
+            images = await asyncio.to_thread(self._scan_images, directory)
+            if images is None:
                 self.logger.warning(f"📁 Directory does not exist: {directory}")
                 return None
 
-            # Get all image files
-            image_extensions = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".cr2"}
-            image_files = []
-
-            for file_path in dir_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in image_extensions:
-                    image_files.append(file_path)
-
-            if not image_files:
+            if not images:
                 self.logger.warning(
                     f"📁 No image files found in directory: {directory}"
                 )
                 return None
 
-            # Sort by modification time (newest first)
-            latest_file = max(image_files, key=lambda f: f.stat().st_mtime)
+            # Newest by modification time, without sorting the whole listing
+            _, latest_file = max(images)
 
             self.logger.info(f"📁 Latest image found: {latest_file}")
-            return str(latest_file)
+            return latest_file
 
         except Exception as e:
             self.logger.error(f"📁 Error getting latest image: {e}")
@@ -116,24 +121,22 @@ class LocalFileManagementService(FileManagementService):
             self.logger.error(f"📁 Error getting file modified time {file_path}: {e}")
             return None
 
-    async def list_image_files(self, directory: str) -> List[str]:
-        """List all image files in directory."""
+    async def list_image_files(
+        self, directory: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """List image files in directory, newest first, optionally only the first N."""
         try:
-            dir_path = Path(directory)
-            if not dir_path.exists():
+            images = await asyncio.to_thread(self._scan_images, directory)
+            if images is None:
                 self.logger.warning(f"📁 Directory does not exist: {directory}")
                 return []
 
-            # Get all image files
-            image_extensions = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".cr2"}
-            image_files = []
-
-            for file_path in dir_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in image_extensions:
-                    image_files.append(str(file_path))
-
             # Sort by modification time (newest first)
-            image_files.sort(key=lambda f: Path(f).stat().st_mtime, reverse=True)
+            if limit is None:
+                images.sort(reverse=True)
+            else:
+                images = heapq.nlargest(limit, images)
+            image_files = [path for _, path in images]
 
             self.logger.info(f"📁 Found {len(image_files)} image files in {directory}")
             return image_files
@@ -142,18 +145,57 @@ class LocalFileManagementService(FileManagementService):
             self.logger.error(f"📁 Error listing image files in {directory}: {e}")
             return []
 
+    def _scan_images(self, directory: str) -> Optional[List[Tuple[float, str]]]:
+        """Return (mtime, path) for every image in directory, or None if missing.
+
+        One scandir pass; the file type and mtime come from the directory
+        entries instead of separate is_file()/stat() calls per path. Hidden
+        entries, such as the thumbnail cache, are skipped. The
+        result is reused while the directory's own mtime is unchanged, since
+        adding, removing or renaming an image always bumps it.
+        """
+        try:
+            dir_mtime = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = self._scan_cache.get(directory)
+        if cached is not None and cached[0] == dir_mtime:
+            return list(cached[1])
+
+        scan_time = time.time_ns()
+        try:
+            with os.scandir(directory) as entries:
+                images = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in entries
+                    if not entry.name.startswith(".")
+                    and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return None
+
+        # Filesystem timestamps are coarse, so a file created in the same tick
+        # as the scan may not move the directory mtime; only trust listings
+        # taken well after the last change
+        if scan_time - dir_mtime > SCAN_CACHE_MIN_AGE_NS:
+            self._scan_cache[directory] = (dir_mtime, images)
+        else:
+            self._scan_cache.pop(directory, None)
+        return list(images)
+
     async def delete_file(self, file_path: str) -> bool:
         """Delete a file."""
         try:
-            path = Path(file_path)
-            if not path.exists():
-                self.logger.warning(f"📁 File does not exist for deletion: {file_path}")
-                return False
-
-            path.unlink()
+            # Unlink off the event loop, it can stall on SD card storage
+            await asyncio.to_thread(os.unlink, file_path)
             self.logger.info(f"📁 Deleted file: {file_path}")
             return True
 
+        except FileNotFoundError:
+            self.logger.warning(f"📁 File does not exist for deletion: {file_path}")
+            return False
         except Exception as e:
             self.logger.error(f"📁 Error deleting file {file_path}: {e}")
             return False
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import os
+import tempfile
 import cv2
 import numpy as np
 from pathlib import Path
@@ -12,6 +15,13 @@ from ..domain.entities import ImageProcessingConfiguration
 class OpenCVImageProcessingService(ImageProcessingService):
     """OpenCV-based image processing service."""
 
+    # Thumbnails are cached as <name>.thumb.jpg in a hidden subdirectory of the
+    # image's directory, which the image listings skip. The full name keeps
+    # RAW+JPEG pairs apart
+    THUMBNAIL_DIRECTORY = ".thumbnails"
+    THUMBNAIL_SUFFIX = ".thumb.jpg"
+    THUMBNAIL_MAX_WIDTH = 640
+
     def __init__(self, config: ImageProcessingConfiguration):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -98,10 +108,77 @@ class OpenCVImageProcessingService(ImageProcessingService):
             self.logger.error(f"🖼️ Error reading PPM image: {e}")
             return None
 
+    async def get_thumbnail(
+        self, image_path: str, max_width: int = THUMBNAIL_MAX_WIDTH
+    ) -> Optional[str]:
+        """Get a cached JPEG thumbnail of the image, creating it if stale."""
+        image = Path(image_path)
+        thumbnail_path = str(
+            image.parent
+            / self.THUMBNAIL_DIRECTORY
+            / (image.name + self.THUMBNAIL_SUFFIX)
+        )
+        try:
+            if os.path.exists(thumbnail_path) and os.path.getmtime(
+                thumbnail_path
+            ) >= os.path.getmtime(image_path):
+                return thumbnail_path
+
+            self.logger.info(f"🖼️ Creating thumbnail for {image_path}")
+            created = await asyncio.to_thread(
+                self._write_thumbnail, image_path, thumbnail_path, max_width
+            )
+            return thumbnail_path if created else None
+
+        except Exception as e:
+            self.logger.error(f"🖼️ Error creating thumbnail for {image_path}: {e}")
+            return None
+
+    def _write_thumbnail(
+        self, image_path: str, thumbnail_path: str, max_width: int
+    ) -> bool:
+        """Decode at reduced scale, shrink to max_width and write a JPEG."""
+        # libjpeg scales by 1/4 during IDCT, far cheaper than a full decode.
+        # Sources too narrow to stay at max_width after that are decoded at
+        # full size instead; they are small, so the second decode is cheap
+        image = cv2.imread(image_path, cv2.IMREAD_REDUCED_COLOR_4)
+        if image is None or image.size == 0 or image.shape[1] < max_width:
+            image = cv2.imread(image_path)
+        if image is None:
+            self.logger.warning(f"🖼️ Could not read image: {image_path}")
+            return False
+
+        height, width = image.shape[:2]
+        if width > max_width:
+            new_height = max(1, round(height * max_width / width))
+            image = cv2.resize(
+                image, (max_width, new_height), interpolation=cv2.INTER_AREA
+            )
+
+        ret, buffer = cv2.imencode(
+            ".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, self.config.default_jpeg_quality]
+        )
+        if not ret:
+            return False
+
+        # Write to a temporary file and rename it into place, so a concurrent
+        # request never serves a half-written thumbnail
+        thumbnail_directory = os.path.dirname(thumbnail_path)
+        os.makedirs(thumbnail_directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=thumbnail_directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(buffer.tobytes())
+            os.replace(temp_path, thumbnail_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return True
+
     def _add_timestamp_to_image(self, image: np.ndarray) -> np.ndarray:
         """Add timestamp overlay to numpy image array."""
         now = datetime.now()
-        timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # trim to ms
+        timestamp_str = now.isoformat(sep=" ", timespec="milliseconds")
 
         font = cv2.FONT_HERSHEY_SIMPLEX
         font_scale = self.config.timestamp_font_scale
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, List, Optional
+
+from ..domain.entities import LiveViewResult
+
+
+class LiveViewFrameHub:
+    """Fans out a single live view capture loop to any number of stream clients.
+
+    One background task pulls frames from the camera and writes them into a
+    small ring of slots. Clients wait on a broadcast event and always read the
+    latest ready slot, so slow clients skip frames instead of stalling capture.
+    """
+
+    SLOT_COUNT = 3
+
+    def __init__(
+        self,
+        stream_factory: Callable[..., AsyncIterator[LiveViewResult]],
+        on_idle: Optional[Callable[["LiveViewFrameHub"], None]] = None,
+    ):
+        self._stream_factory = stream_factory
+        self._on_idle = on_idle
+        self.logger = logging.getLogger(__name__)
+        self._slots: List[Optional[LiveViewResult]] = [None] * self.SLOT_COUNT
+        self._index = 0
+        self._sequence = 0
+        self._event = asyncio.Event()
+        self._pump_task: Optional[asyncio.Task] = None
+        self._subscribers = 0
+        self._finished = False
+
+    @property
+    def subscriber_count(self) -> int:
+        """Get the number of connected stream clients."""
+        return self._subscribers
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the capture loop is running."""
+        return self._pump_task is not None and not self._pump_task.done()
+
+    async def frames(self, *stream_args: Any) -> AsyncGenerator[LiveViewResult, None]:
+        """Yield the latest captured frame each time a new one is published.
+
+        The client that starts the capture loop passes stream_args to the
+        stream factory; clients joining a running loop share its frames.
+        """
+        self._subscribers += 1
+        if not self.is_running:
+            self._start_pump(stream_args)
+
+        last_sequence = self._sequence
+        try:
+            while True:
+                if self._sequence == last_sequence:
+                    if self._finished:
+                        return
+                    await self._event.wait()
+                    continue
+
+                last_sequence = self._sequence
+                result = self._slots[self._index]
+                if result is None:
+                    continue
+
+                yield result
+
+                if not result.success:
+                    return
+        finally:
+            self._subscribers -= 1
+            if self._subscribers == 0:
+                await self.stop()
+                # A client may have joined and restarted capture meanwhile
+                if self._subscribers == 0 and self._on_idle:
+                    self._on_idle(self)
+
+    async def stop(self) -> None:
+        """Stop the capture loop."""
+        task = self._pump_task
+        self._pump_task = None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _start_pump(self, stream_args: tuple) -> None:
+        """Reset the ring and start the background capture loop."""
+        self._slots = [None] * self.SLOT_COUNT
+        self._finished = False
+        self._pump_task = asyncio.create_task(self._pump(stream_args))
+
+    async def _pump(self, stream_args: tuple) -> None:
+        """Capture frames and publish each one to the next ring slot."""
+        stream = self._stream_factory(*stream_args)
+        try:
+            async for result in stream:
+                self._publish(result)
+                if not result.success:
+                    break
+        except Exception as e:
+            self.logger.error(f"🎥 Error in live view capture loop: {e}", exc_info=True)
+            # Hand clients a failure frame so their streams end with an error
+            # instead of just stopping
+            self._publish(
+                LiveViewResult(success=False, message=f"Live view capture failed: {e}")
+            )
+        finally:
+            self._finished = True
+            self._event.set()
+            self._event.clear()
+            aclose = getattr(stream, "aclose", None)
+            if aclose:
+                await aclose()
+
+    def _publish(self, result: LiveViewResult) -> None:
+        """Write a frame into the next slot and wake all waiting clients."""
+        next_index = (self._index + 1) % self.SLOT_COUNT
+        self._slots[next_index] = result
+        self._index = next_index
+        self._sequence += 1
+        self._event.set()
+        self._event.clear()
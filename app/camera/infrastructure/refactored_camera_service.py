@@ -1,10 +1,12 @@
 import logging
 import asyncio
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List
 from datetime import datetime
 
 from ..domain.entities import (
+    AutoShootParams,
+    BurstShootParams,
     CameraConfiguration,
     CameraShootingResult,
     LiveViewResult,
@@ -12,12 +14,34 @@ from ..domain.entities import (
     CameraCommand,
     ManualShootingParameters,
     ManualShootingResult,
+    ShootParams,
+    build_shooting_id,
 )
 from ..domain.services import CameraControlService
-from .subprocess_service import CHDKPTPSubprocessService
+from .subprocess_service import CHDKPTPSubprocessService, quote_chdkptp_argument
 from .image_processing_service import OpenCVImageProcessingService
 from .file_management_service import LocalFileManagementService
 
+# Static chdkptp arguments, shared by every command of the same kind. The
+# subprocess service only reads these lists, it never extends them in place.
+_LIVE_VIEW_ARGS = [
+    "-c",  # connect
+    "-erec",  # switch to record mode
+    "-elvdumpimg -vp=frame.ppm -count=1",  # live view dump
+]
+_SHOOT_PREFIX_ARGS = [
+    "-ec",  # connect
+    "-erec",  # switch to record mode
+]
+_SHOOT_SUFFIX_ARGS = [
+    "-eplay",  # switch to play mode
+    "-edisconnect",  # disconnect
+]
+_CONNECTION_PROBE_ARGS = [
+    "-c",  # connect
+    "-elua return true",  # round trip to the camera without changing its state
+]
+
 
 class RefactoredCHDKPTPCameraService(CameraControlService):
     """Refactored CHDKPTP-based camera service with better separation of concerns."""
@@ -35,7 +59,21 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self._streaming = False
+        # Bumped by every stream start, so a stream that is finishing only
+        # clears _streaming if no newer stream has started since
+        self._stream_generation = 0
         self._frame_path = Path(config.chdkptp_location) / config.frame_file_name
+        self._command_handlers = {
+            "shoot": self._execute_shoot,
+            "auto_shoot": self._execute_auto_shoot,
+            "burst_shoot": self._execute_burst_shoot,
+        }
+        self._rs_destination = quote_chdkptp_argument(config.output_directory)
+        self._shoot_args = [
+            *_SHOOT_PREFIX_ARGS,
+            f"-ers {self._rs_destination}",  # remote shoot
+            *_SHOOT_SUFFIX_ARGS,
+        ]
 
     async def shoot_camera(self) -> CameraShootingResult:
         """Shoot camera and return the result with image path."""
@@ -52,21 +90,12 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
                     timestamp=datetime.now(),
                 )
 
-            # Build shooting command
-            cmd_args = [
-                "-ec",  # connect
-                "-erec",  # switch to record mode
-                f"-ers {self.config.output_directory}",  # remote shoot
-                "-eplay",  # switch to play mode
-                "-edisconnect",  # disconnect
-            ]
-
             # Execute command
             (
                 success,
                 stdout,
                 stderr,
-            ) = await self.subprocess_service.execute_chdkptp_command(cmd_args)
+            ) = await self.subprocess_service.execute_chdkptp_command(self._shoot_args)
 
             if success:
                 self.logger.info("📸 Camera shooting completed successfully")
@@ -75,14 +104,15 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
                 image_path = await self.file_service.get_latest_image(
                     self.config.output_directory
                 )
-                shooting_id = f"shooting_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                now = datetime.now()
+                shooting_id = build_shooting_id("shooting", now)
 
                 return CameraShootingResult(
                     success=True,
                     message="Camera shooting completed",
                     shooting_id=shooting_id,
                     image_path=image_path,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                 )
             else:
                 self.logger.error(f"📸 Camera shooting failed: {stderr}")
@@ -109,13 +139,8 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
         try:
             self.logger.info(f"📸 Executing camera command: {command.command_type}")
 
-            if command.command_type == "shoot":
-                return await self.shoot_camera()
-            elif command.command_type == "auto_shoot":
-                return await self._execute_auto_shoot(command.parameters)
-            elif command.command_type == "burst_shoot":
-                return await self._execute_burst_shoot(command.parameters)
-            else:
+            handler = self._command_handlers.get(command.command_type)
+            if handler is None:
                 return CameraShootingResult(
                     success=False,
                     message=f"Unknown command type: {command.command_type}",
@@ -123,6 +148,7 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
                     image_path=None,
                     timestamp=datetime.now(),
                 )
+            return await handler(command.parameters)
 
         except Exception as e:
             self.logger.error(f"📸 Error executing command: {e}")
@@ -156,21 +182,19 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
 
             # Build manual shooting command based on the bash script
             cmd_args = [
-                "-ec",  # connect
-                "-erec",  # switch to record mode
+                *_SHOOT_PREFIX_ARGS,
                 "-eclock -sync",  # sync clock
                 "-eluar set_lcd_display(0)",  # turn off LCD
                 "-eluar set_mf(1)",  # set manual focus
                 "-eluar set_aelock(1)",  # set AE lock
                 "-eluar set_aflock(1)",  # set AF lock
-                f"-ers {self.config.output_directory} "
+                f"-ers {self._rs_destination} "
                 f"-shots={parameters.shots} "
                 f"-int={parameters.interval} "
                 f"-tv={parameters.speed} "
                 f"-sd={parameters.subject_distance} "
                 f"-isomode={parameters.iso}",  # remote shoot with parameters
-                "-eplay",  # switch to play mode
-                "-edisconnect",  # disconnect
+                *_SHOOT_SUFFIX_ARGS,
             ]
 
             # Execute command
@@ -188,12 +212,12 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
 
                 # Get the latest images from the output directory
                 # We expect multiple images based on the shots parameter
-                all_images = await self.file_service.list_image_files(
-                    self.config.output_directory
+                # Take the newest N images (newest first)
+                image_paths = await self.file_service.list_image_files(
+                    self.config.output_directory, limit=parameters.shots
                 )
-                # Take the first N images (newest first)
-                image_paths = all_images[: parameters.shots] if all_images else []
-                shooting_id = f"manual_shoot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                now = datetime.now()
+                shooting_id = build_shooting_id("manual_shoot", now)
 
                 return ManualShootingResult(
                     success=True,
@@ -201,7 +225,7 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
                     shooting_id=shooting_id,
                     images_captured=len(image_paths),
                     image_paths=image_paths,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                 )
             else:
                 self.logger.error(f"📸 Manual shooting failed: {stderr}")
@@ -233,17 +257,11 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
             self.logger.info("📸 Starting live view snapshot...")
 
             # Execute live view command
-            cmd_args = [
-                "-c",  # connect
-                "-erec",  # switch to record mode
-                "-elvdumpimg -vp=frame.ppm -count=1",  # live view dump
-            ]
-
             (
                 success,
                 stdout,
                 stderr,
-            ) = await self.subprocess_service.execute_chdkptp_command(cmd_args)
+            ) = await self.subprocess_service.execute_chdkptp_command(_LIVE_VIEW_ARGS)
 
             if not success:
                 return LiveViewResult(
@@ -295,28 +313,26 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
         self, config: LiveViewStream
     ) -> AsyncGenerator[LiveViewResult, None]:
         """Start a live view stream and yield image frames."""
+        self._stream_generation += 1
+        generation = self._stream_generation
         try:
             self.logger.info("🎥 Starting live view stream...")
             self._streaming = True
             frame_count = 0
+            frame_interval = 1.0 / config.framerate
 
-            while self._streaming:
+            while self._streaming and self._stream_generation == generation:
                 try:
                     frame_count += 1
-                    self.logger.info(f"🎥 Taking frame {frame_count}...")
-
-                    # Execute live view command
-                    cmd_args = [
-                        "-c",  # connect
-                        "-erec",  # switch to record mode
-                        "-elvdumpimg -vp=frame.ppm -count=1",  # live view dump
-                    ]
+                    self.logger.debug(f"🎥 Taking frame {frame_count}...")
 
                     (
                         success,
                         stdout,
                         stderr,
-                    ) = await self.subprocess_service.execute_chdkptp_command(cmd_args)
+                    ) = await self.subprocess_service.execute_chdkptp_command(
+                        _LIVE_VIEW_ARGS
+                    )
 
                     if not success:
                         self.logger.warning(
@@ -346,7 +362,6 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
                     )
 
                     # Wait for next frame
-                    frame_interval = 1.0 / config.framerate
                     await asyncio.sleep(frame_interval)
 
                 except Exception as e:
@@ -372,7 +387,8 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
                 timestamp=datetime.now(),
             )
         finally:
-            self._streaming = False
+            if self._stream_generation == generation:
+                self._streaming = False
             self.logger.info("🎥 Live view stream stopped")
 
     async def stop_live_view_stream(self) -> None:
@@ -380,12 +396,66 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
         self.logger.info("🎥 Stopping live view stream...")
         self._streaming = False
 
-    async def _execute_auto_shoot(self, parameters: dict) -> CameraShootingResult:
+    async def is_camera_connected(self) -> bool:
+        """Check whether the camera can be reached."""
+        success, _, stderr = await self.subprocess_service.execute_chdkptp_command(
+            _CONNECTION_PROBE_ARGS
+        )
+        if not success:
+            self.logger.info(f"📸 Camera connection check failed: {stderr}")
+        return success
+
+    async def _shoot_series(self, shots: int, interval: float) -> List[str]:
+        """Take a series of shots in one chdkptp run and return their image paths.
+
+        chdkptp paces the shots itself, so the camera is connected and switched
+        to record mode once per series instead of once per shot.
+        """
+        if not await self.subprocess_service.validate_executable("chdkptp.sh"):
+            self.logger.error("📸 CHDKPTP script not found")
+            return []
+
+        # Only images that appear during this run belong to the series
+        existing_images = set(
+            await self.file_service.list_image_files(self.config.output_directory)
+        )
+
+        cmd_args = [
+            *_SHOOT_PREFIX_ARGS,
+            f"-ers {self._rs_destination} "
+            f"-shots={shots} "
+            f"-int={interval}",  # remote shoot series
+            *_SHOOT_SUFFIX_ARGS,
+        ]
+
+        (
+            success,
+            stdout,
+            stderr,
+        ) = await self.subprocess_service.execute_chdkptp_command(cmd_args)
+
+        if not success:
+            self.logger.error(f"📸 Shooting series failed: {stderr}")
+            return []
+
+        # Newest first, so take the first N new images and return them in
+        # shooting order
+        images = await self.file_service.list_image_files(self.config.output_directory)
+        new_images = [path for path in images if path not in existing_images]
+        return new_images[:shots][::-1]
+
+    async def _execute_shoot(self, parameters: ShootParams) -> CameraShootingResult:
+        """Execute a single shot."""
+        return await self.shoot_camera()
+
+    async def _execute_auto_shoot(
+        self, parameters: AutoShootParams
+    ) -> CameraShootingResult:
         """Execute automatic shooting with parameters."""
         try:
-            shots = parameters.get("shots", 1)
-            interval = parameters.get("interval", 1.0)
-            delay = parameters.get("delay", 0)
+            shots = parameters.shots
+            interval = parameters.interval
+            delay = parameters.delay
 
             self.logger.info(
                 f"📸 Auto shoot: {shots} shots, {interval}s interval, {delay}s delay"
@@ -395,22 +465,13 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
             if delay > 0:
                 await asyncio.sleep(delay)
 
-            # Take shots
-            image_paths = []
-            for i in range(shots):
-                self.logger.info(f"📸 Taking shot {i + 1}/{shots}")
-                result = await self.shoot_camera()
-
-                if result.success and result.image_path:
-                    image_paths.append(result.image_path)
-
-                # Wait between shots (except for the last shot)
-                if i < shots - 1:
-                    await asyncio.sleep(interval)
+            # Take all shots in a single chdkptp session
+            image_paths = await self._shoot_series(shots, interval)
 
             # Return the last image path
             final_image_path = image_paths[-1] if image_paths else None
-            shooting_id = f"auto_shoot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            now = datetime.now()
+            shooting_id = build_shooting_id("auto_shoot", now)
 
             return CameraShootingResult(
                 success=len(image_paths) > 0,
@@ -419,7 +480,7 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
                 ),
                 shooting_id=shooting_id,
                 image_path=final_image_path,
-                timestamp=datetime.now(),
+                timestamp=now,
             )
 
         except Exception as e:
@@ -432,39 +493,32 @@ class RefactoredCHDKPTPCameraService(CameraControlService):
                 timestamp=datetime.now(),
             )
 
-    async def _execute_burst_shoot(self, parameters: dict) -> CameraShootingResult:
+    async def _execute_burst_shoot(
+        self, parameters: BurstShootParams
+    ) -> CameraShootingResult:
         """Execute burst shooting (rapid fire)."""
         try:
-            shots = parameters.get("shots", 3)
-            burst_interval = parameters.get("burst_interval", 0.5)
+            shots = parameters.shots
+            burst_interval = parameters.burst_interval
 
             self.logger.info(
                 f"📸 Burst shoot: {shots} shots, {burst_interval}s interval"
             )
 
-            # Take rapid shots
-            image_paths = []
-            for i in range(shots):
-                self.logger.info(f"📸 Burst shot {i + 1}/{shots}")
-                result = await self.shoot_camera()
-
-                if result.success and result.image_path:
-                    image_paths.append(result.image_path)
-
-                # Short wait between burst shots
-                if i < shots - 1:
-                    await asyncio.sleep(burst_interval)
+            # Take rapid shots in a single chdkptp session
+            image_paths = await self._shoot_series(shots, burst_interval)
 
             # Return the last image path
             final_image_path = image_paths[-1] if image_paths else None
-            shooting_id = f"burst_shoot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            now = datetime.now()
+            shooting_id = build_shooting_id("burst_shoot", now)
 
             return CameraShootingResult(
                 success=len(image_paths) > 0,
                 message=f"Burst shoot completed: {len(image_paths)}/{shots} shots taken",
                 shooting_id=shooting_id,
                 image_path=final_image_path,
-                timestamp=datetime.now(),
+                timestamp=now,
             )
 
         except Exception as e:
@@ -1,55 +1,107 @@
 import asyncio
 import logging
 import os
+import re
+import shlex
 from pathlib import Path
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from ..domain.services import SubprocessService
 
+# Interactive chdkptp prompt, e.g. "con> " when connected or "___> " when not
+_PROMPT_PATTERN = re.compile(rb"(?:^|\n)(?:con|___)[^\n]*> $")
+
+# chdkptp reports a failed command on a line of its own starting "ERROR: "
+_ERROR_LINE_PATTERN = re.compile(r"^ERROR: ?(.*)$", re.MULTILINE)
+
+# Connection handling is done once per session, not per command
+_SESSION_CONNECTION_COMMANDS = frozenset({"c", "connect", "dis", "disconnect"})
+
+# Shot count and interval of a remote shoot series, e.g. "rs -shots=5 -int=2"
+_SHOTS_PATTERN = re.compile(r"-shots=(\d+)")
+_INTERVAL_PATTERN = re.compile(r"-int=(\d+(?:\.\d+)?)")
+
+
+def quote_chdkptp_argument(value: str) -> str:
+    """Quote a value for a chdkptp command line, e.g. a path with spaces.
+
+    chdkptp splits "rs /some dir" on whitespace itself, so paths must be
+    double quoted inside the command, with quotes and backslashes escaped.
+    """
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
 
 class CHDKPTPSubprocessService(SubprocessService):
     """CHDKPTP subprocess execution service."""
 
-    def __init__(self, chdkptp_location: str):
+    def __init__(
+        self,
+        chdkptp_location: str,
+        persistent_session: bool = False,
+        use_sudo: bool = True,
+        command_timeout: float = 30,
+    ):
         self.chdkptp_location = Path(chdkptp_location)
+        self.persistent_session = persistent_session
+        self.command_timeout = command_timeout
         self.logger = logging.getLogger(__name__)
+        # The session's pipes and lock belong to the event loop that started
+        # it; callers on other loops (e.g. the monitor thread) run there too
+        self._session: Optional[asyncio.subprocess.Process] = None
+        self._session_lock = asyncio.Lock()
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._chdkptp_script = str(self.chdkptp_location / "chdkptp.sh")
+        self._chdkptp_script_found = False
+        # Without sudo, chdkptp.sh is exec'd directly, saving a sudo process
+        # and its PAM/sudoers lookup on every command
+        self._command_prefix = (
+            ["sudo", self._chdkptp_script] if use_sudo else [self._chdkptp_script]
+        )
 
     async def validate_executable(self, executable_path: str) -> bool:
         """Validate if executable exists and is accessible."""
         try:
-            chdkptp_script = self.chdkptp_location / "chdkptp.sh"
-            return chdkptp_script.exists()
+            return self._chdkptp_script_exists()
         except Exception as e:
             self.logger.error(f"Error validating executable {executable_path}: {e}")
             return False
 
+    def _chdkptp_script_exists(self) -> bool:
+        """Check for the CHDKPTP script, remembering it once it has been found.
+
+        The script does not move while the service is running, so only a
+        missing script is checked again (e.g. on a late mount).
+        """
+        if not self._chdkptp_script_found:
+            self._chdkptp_script_found = os.path.isfile(self._chdkptp_script)
+        return self._chdkptp_script_found
+
     async def execute_command(
         self, command: list, working_directory: str
     ) -> Tuple[bool, str, str]:
         """Execute command and return (success, stdout, stderr)."""
         try:
-            self.logger.info(f"🔧 Executing command: {' '.join(command)}")
-            self.logger.info(f"🔧 Working directory: {working_directory}")
-
-            # Change to working directory
-            original_cwd = os.getcwd()
-            os.chdir(working_directory)
-            self.logger.info(f"🔧 Changed to directory: {os.getcwd()}")
-
-            try:
-                # Run the command
-                process = await asyncio.create_subprocess_exec(
-                    *command,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"🔧 Executing command: {shlex.join(command)}")
+                self.logger.info(f"🔧 Working directory: {working_directory}")
 
-                stdout, stderr = await process.communicate()
+            # Run the command in the working directory without touching the
+            # process-wide cwd, so concurrent commands cannot interfere
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=working_directory,
+            )
 
-                success = process.returncode == 0
-                stdout_str = stdout.decode() if stdout else ""
-                stderr_str = stderr.decode() if stderr else ""
+            stdout, stderr = await process.communicate()
 
+            success = process.returncode == 0
+            stdout_str = stdout.decode(errors="replace") if stdout else ""
+            stderr_str = stderr.decode(errors="replace") if stderr else ""
+
+            if self.logger.isEnabledFor(logging.INFO):
                 self.logger.info(
                     f"🔧 Command completed with return code: {process.returncode}"
                 )
@@ -58,38 +110,34 @@ class CHDKPTPSubprocessService(SubprocessService):
                 if stderr_str:
                     self.logger.info(f"🔧 stderr: {stderr_str}")
 
-                return success, stdout_str, stderr_str
-
-            finally:
-                # Restore original directory
-                os.chdir(original_cwd)
-                self.logger.info(f"🔧 Restored directory to: {os.getcwd()}")
+            return success, stdout_str, stderr_str
 
         except Exception as e:
             self.logger.error(f"🔧 Exception in execute_command: {e}")
             return False, "", str(e)
 
     async def build_chdkptp_command(self, arguments: list) -> list:
-        """Build a complete CHDKPTP command with sudo and script path."""
-        chdkptp_script = self.chdkptp_location / "chdkptp.sh"
-
-        if not chdkptp_script.exists():
-            raise FileNotFoundError(f"CHDKPTP script not found: {chdkptp_script}")
+        """Build a complete CHDKPTP command with the script path (and sudo)."""
+        if not self._chdkptp_script_exists():
+            raise FileNotFoundError(f"CHDKPTP script not found: {self._chdkptp_script}")
 
         # Check if this is a full command or just arguments
-        if arguments and not arguments[0].startswith("sudo"):
+        if arguments and arguments[0] not in ("sudo", self._chdkptp_script):
             # This is just arguments, need to build the full command
-            full_cmd = ["sudo", str(chdkptp_script)] + arguments
-            self.logger.info(f"🔧 Built full command: {full_cmd}")
+            full_cmd = self._command_prefix + arguments
+            self.logger.debug("🔧 Built full command: %s", full_cmd)
         else:
             # This is already a full command
             full_cmd = arguments
-            self.logger.info(f"🔧 Using existing full command: {full_cmd}")
+            self.logger.debug("🔧 Using existing full command: %s", full_cmd)
 
         return full_cmd
 
     async def execute_chdkptp_command(self, arguments: list) -> Tuple[bool, str, str]:
         """Execute a CHDKPTP command with proper setup."""
+        if self.persistent_session:
+            return await self.execute_session_command(arguments)
+
         try:
             # Build the command
             command = await self.build_chdkptp_command(arguments)
@@ -102,3 +150,215 @@ class CHDKPTPSubprocessService(SubprocessService):
         except Exception as e:
             self.logger.error(f"🔧 Error executing CHDKPTP command: {e}")
             return False, "", str(e)
+
+    async def execute_session_command(self, arguments: list) -> Tuple[bool, str, str]:
+        """Execute CHDKPTP arguments on the long-lived interactive process."""
+        owner_loop = self._session_owner_loop()
+        if owner_loop is not None:
+            return await self._run_on_loop(
+                owner_loop, self.execute_session_command(arguments)
+            )
+
+        commands = self._arguments_to_session_commands(arguments)
+
+        async with self._session_lock:
+            for attempt in range(2):
+                try:
+                    session = await self._ensure_session()
+                    output = []
+                    for command in commands:
+                        output.append(
+                            await self._send_session_command(
+                                session, command, self._command_budget(command)
+                            )
+                        )
+
+                    stdout_str = "".join(output)
+                    errors = _ERROR_LINE_PATTERN.findall(stdout_str)
+                    if not errors:
+                        return True, stdout_str, ""
+
+                    if attempt == 0 and any("not connected" in e for e in errors):
+                        # The camera dropped off USB, reconnect with a new session
+                        self.logger.warning(
+                            "🔧 Camera disconnected, restarting session"
+                        )
+                        await self._terminate_session()
+                        continue
+
+                    return False, stdout_str, "\n".join(errors)
+
+                except asyncio.TimeoutError:
+                    # A hung chdkptp would otherwise hold the lock forever
+                    self.logger.error("🔧 CHDKPTP session command timed out")
+                    self._kill_session()
+                    return False, "", "CHDKPTP session command timed out"
+
+                except (BrokenPipeError, ConnectionResetError, EOFError) as e:
+                    # The process died, restart it once like a pool pre-ping
+                    self.logger.warning(f"🔧 CHDKPTP session lost, restarting: {e}")
+                    await self._terminate_session()
+                    if attempt == 1:
+                        return False, "", str(e)
+
+                except Exception as e:
+                    self.logger.error(
+                        f"🔧 Error executing CHDKPTP session command: {e}"
+                    )
+                    await self._terminate_session()
+                    return False, "", str(e)
+
+        return False, "", "CHDKPTP session unavailable"
+
+    async def close(self) -> None:
+        """Terminate the interactive CHDKPTP process if it is running."""
+        owner_loop = self._session_owner_loop()
+        if owner_loop is not None:
+            await self._run_on_loop(owner_loop, self.close())
+            return
+
+        async with self._session_lock:
+            await self._terminate_session()
+
+    def _session_owner_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Get the session's loop if the caller must run there instead.
+
+        A session left behind by a closed loop is killed, and the session is
+        rebound to the calling loop.
+        """
+        loop = asyncio.get_running_loop()
+        owner_loop = self._session_loop
+        if owner_loop is loop:
+            return None
+        if owner_loop is not None and owner_loop.is_running():
+            return owner_loop
+
+        self._kill_session()
+        self._session_lock = asyncio.Lock()
+        self._session_loop = loop
+        return None
+
+    @staticmethod
+    async def _run_on_loop(loop: asyncio.AbstractEventLoop, coroutine):
+        """Run a coroutine on another thread's event loop and await its result."""
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, loop)
+        )
+
+    def _command_budget(self, command: str) -> float:
+        """Get the time a session command may take before it counts as hung.
+
+        A remote shoot series takes at least its shots times the interval.
+        """
+        budget = self.command_timeout
+        shots = _SHOTS_PATTERN.search(command)
+        if shots:
+            interval = _INTERVAL_PATTERN.search(command)
+            budget += int(shots.group(1)) * (
+                float(interval.group(1)) if interval else 1.0
+            )
+        return budget
+
+    async def _ensure_session(self) -> asyncio.subprocess.Process:
+        """Return a live interactive CHDKPTP process, starting one if needed."""
+        if self._session is not None and self._session.returncode is None:
+            return self._session
+
+        command = await self.build_chdkptp_command(["-i"])
+        self.logger.info(f"🔧 Starting CHDKPTP session: {command}")
+
+        self._session = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=str(self.chdkptp_location),
+        )
+        await self._read_until_prompt(self._session, self.command_timeout)
+
+        # Connect once; commands then reuse the open connection
+        output = await self._send_session_command(
+            self._session, "c", self.command_timeout
+        )
+        errors = _ERROR_LINE_PATTERN.findall(output)
+        if errors:
+            await self._terminate_session()
+            raise ConnectionError(f"CHDKPTP could not connect: {errors[0]}")
+
+        return self._session
+
+    async def _send_session_command(
+        self,
+        session: asyncio.subprocess.Process,
+        command: str,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Write one command to the session and return its output."""
+        session.stdin.write(command.encode() + b"\n")
+        await session.stdin.drain()
+        return await self._read_until_prompt(session, timeout)
+
+    async def _read_until_prompt(
+        self, session: asyncio.subprocess.Process, timeout: Optional[float] = None
+    ) -> str:
+        """Read session output until the interactive prompt is shown again.
+
+        Raises asyncio.TimeoutError if the prompt takes longer than timeout.
+        """
+        buffer = bytearray()
+
+        async def read_output():
+            while not _PROMPT_PATTERN.search(buffer):
+                chunk = await session.stdout.read(4096)
+                if not chunk:
+                    raise EOFError("CHDKPTP session closed")
+                buffer.extend(chunk)
+
+        await asyncio.wait_for(read_output(), timeout)
+
+        # Drop the trailing prompt from the returned output
+        output = _PROMPT_PATTERN.sub(b"\n", bytes(buffer))
+        return output.decode(errors="replace")
+
+    def _kill_session(self) -> None:
+        """Kill the interactive process without waiting for it, and forget it."""
+        session = self._session
+        self._session = None
+        if session is None or session.returncode is not None:
+            return
+
+        try:
+            session.kill()
+        except ProcessLookupError:
+            # A closed loop has already killed the processes it started
+            pass
+
+    async def _terminate_session(self) -> None:
+        """Kill the interactive process and forget it."""
+        session = self._session
+        self._session = None
+        if session is None or session.returncode is not None:
+            return
+
+        try:
+            session.stdin.write(b"quit\n")
+            await session.stdin.drain()
+            await asyncio.wait_for(session.wait(), timeout=2)
+        except Exception:
+            session.kill()
+            await session.wait()
+
+    @staticmethod
+    def _arguments_to_session_commands(arguments: list) -> List[str]:
+        """Translate CLI arguments (e.g. "-erec") into interactive commands.
+
+        Connect and disconnect ("-c", "-ec", "-edisconnect") are dropped, the
+        session keeps the camera connected between commands.
+        """
+        commands = []
+        for argument in arguments:
+            if argument.startswith("-e"):
+                command = argument[2:]
+                if command not in _SESSION_CONNECTION_COMMANDS:
+                    commands.append(command)
+        return commands
@@ -1,10 +1,45 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from ..domain.entities import SunEventPeriod
+from ..domain.entities import SunEvent, SunEventPeriod
 from ..domain.repositories import SunEventRepository
 
+# Sun events for a date never change, so lookups are cached per use case
+SUN_EVENT_CACHE_SIZE = 64
+
+# Repository lookups are keyed by the date at midnight
+MIDNIGHT = time(0, 0)
+
+# Sunrise periods run past the morning golden hour and sunset periods start
+# before the evening golden hour by this margin
+PERIOD_MARGIN = timedelta(minutes=30)
+ONE_DAY = timedelta(days=1)
+
+# Number of days scanned for upcoming periods
+UPCOMING_DAYS = 7
+
+
+def build_sunrise_period(sun_event: SunEvent) -> SunEventPeriod:
+    """Build the sunrise recording period for a sun event."""
+    return SunEventPeriod(
+        period_type="sunrise",
+        event_date=sun_event.date,
+        start_time=sun_event.golden_hour_morning_start,
+        end_time=sun_event.golden_hour_morning_end + PERIOD_MARGIN,
+    )
+
+
+def build_sunset_period(sun_event: SunEvent) -> SunEventPeriod:
+    """Build the sunset recording period for a sun event."""
+    return SunEventPeriod(
+        period_type="sunset",
+        event_date=sun_event.date,
+        start_time=sun_event.golden_hour_evening_start - PERIOD_MARGIN,
+        end_time=sun_event.dusk,
+    )
+
 
 @dataclass
 class GetCurrentEventRequest:
@@ -33,6 +68,8 @@ class CheckUpcomingEventsResponse:
     """Response for checking upcoming sun events."""
 
     upcoming_periods: List[SunEventPeriod]
+    earliest_start: Optional[datetime] = None
+    latest_end: Optional[datetime] = None
 
 
 class GetCurrentSunEventUseCase:
@@ -40,47 +77,29 @@ class GetCurrentSunEventUseCase:
 
     def __init__(self, sun_event_repository: SunEventRepository):
         self.sun_event_repository = sun_event_repository
+        self._get_periods_for_day = lru_cache(maxsize=SUN_EVENT_CACHE_SIZE)(
+            self._load_periods_for_day
+        )
+
+    def _load_periods_for_day(self, day: date) -> Tuple[SunEventPeriod, ...]:
+        """Build a day's sunrise and sunset periods, in start time order."""
+        sun_event = self.sun_event_repository.get_sun_event_by_date_sync(
+            datetime.combine(day, MIDNIGHT)
+        )
+
+        if not sun_event:
+            return ()
+
+        return (build_sunrise_period(sun_event), build_sunset_period(sun_event))
 
     def execute(self, request: GetCurrentEventRequest) -> GetCurrentEventResponse:
         """Execute the use case."""
         current_time = request.current_time
-        current_date = current_time.date()
-
-        # Get today's sun event
-        today_event = self.sun_event_repository.get_sun_event_by_date_sync(
-            datetime.combine(current_date, datetime.min.time())
-        )
 
-        if not today_event:
-            return GetCurrentEventResponse(current_period=None)
-
-        # Check if we're in a sunrise period
-        sunrise_start = today_event.golden_hour_morning_start
-        sunrise_end = today_event.golden_hour_morning_end + timedelta(minutes=30)
-
-        if sunrise_start <= current_time <= sunrise_end:
-            return GetCurrentEventResponse(
-                current_period=SunEventPeriod(
-                    period_type="sunrise",
-                    event_date=today_event.date,
-                    start_time=sunrise_start,
-                    end_time=sunrise_end,
-                )
-            )
-
-        # Check if we're in a sunset period
-        sunset_start = today_event.golden_hour_evening_start - timedelta(minutes=30)
-        sunset_end = today_event.dusk
-
-        if sunset_start <= current_time <= sunset_end:
-            return GetCurrentEventResponse(
-                current_period=SunEventPeriod(
-                    period_type="sunset",
-                    event_date=today_event.date,
-                    start_time=sunset_start,
-                    end_time=sunset_end,
-                )
-            )
+        # Check if we're in one of today's sunrise or sunset periods
+        for period in self._get_periods_for_day(current_time.date()):
+            if period.start_time <= current_time <= period.end_time:
+                return GetCurrentEventResponse(current_period=period)
 
         return GetCurrentEventResponse(current_period=None)
 
@@ -90,6 +109,14 @@ class CheckUpcomingSunEventsUseCase:
 
     def __init__(self, sun_event_repository: SunEventRepository):
         self.sun_event_repository = sun_event_repository
+        self._get_upcoming_sun_events = lru_cache(maxsize=SUN_EVENT_CACHE_SIZE)(
+            self._load_upcoming_sun_events
+        )
+
+    def _load_upcoming_sun_events(self, start_date: date) -> Dict[date, SunEvent]:
+        """Fetch the sun events scanned from a start date in one repository call."""
+        dates = [start_date + ONE_DAY * days for days in range(UPCOMING_DAYS)]
+        return self.sun_event_repository.get_sun_events_by_dates(dates)
 
     def execute(
         self, request: CheckUpcomingEventsRequest
@@ -100,47 +127,29 @@ class CheckUpcomingSunEventsUseCase:
         end_time = current_time + timedelta(minutes=look_ahead_minutes)
 
         upcoming_periods = []
-
-        # Get events for the next few days
-        current_date = current_time.date()
-        for days_ahead in range(7):  # Check next 7 days
-            check_date = current_date + timedelta(days=days_ahead)
-            sun_event = self.sun_event_repository.get_sun_event_by_date_sync(
-                datetime.combine(check_date, datetime.min.time())
-            )
-
-            if not sun_event:
-                continue
-
-            # Calculate sunrise period
-            sunrise_start = sun_event.golden_hour_morning_start
-            sunrise_end = sun_event.golden_hour_morning_end + timedelta(minutes=30)
-
-            if sunrise_start >= current_time and sunrise_start <= end_time:
-                upcoming_periods.append(
-                    SunEventPeriod(
-                        period_type="sunrise",
-                        event_date=sun_event.date,
-                        start_time=sunrise_start,
-                        end_time=sunrise_end,
-                    )
-                )
-
-            # Calculate sunset period
-            sunset_start = sun_event.golden_hour_evening_start - timedelta(minutes=30)
-            sunset_end = sun_event.dusk
-
-            if sunset_start >= current_time and sunset_start <= end_time:
-                upcoming_periods.append(
-                    SunEventPeriod(
-                        period_type="sunset",
-                        event_date=sun_event.date,
-                        start_time=sunset_start,
-                        end_time=sunset_end,
-                    )
-                )
-
-        # Sort by start time
-        upcoming_periods.sort(key=lambda x: x.start_time)
-
-        return CheckUpcomingEventsResponse(upcoming_periods=upcoming_periods)
+        earliest_start: Optional[datetime] = None
+        latest_end: Optional[datetime] = None
+
+        # Get events for the next few days, in date order
+        sun_events = self._get_upcoming_sun_events(current_time.date())
+        for sun_event in sun_events.values():
+            for period in (
+                build_sunrise_period(sun_event),
+                build_sunset_period(sun_event),
+            ):
+                if not current_time <= period.start_time <= end_time:
+                    continue
+
+                upcoming_periods.append(period)
+                if earliest_start is None:
+                    earliest_start = period.start_time
+                if latest_end is None or period.end_time > latest_end:
+                    latest_end = period.end_time
+
+        # Days are walked in order and sunrise precedes sunset, so the periods
+        # are already sorted by start time
+        return CheckUpcomingEventsResponse(
+            upcoming_periods=upcoming_periods,
+            earliest_start=earliest_start,
+            latest_end=latest_end,
+        )
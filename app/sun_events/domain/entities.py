@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class SunEvent:
     """Domain entity representing a sun event for a specific date."""
 
@@ -29,7 +29,7 @@ class SunEvent:
     blue_hour_evening_end: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class SunEventPeriod:
     """Domain entity representing a sunrise or sunset period."""
 
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional
 
 from .entities import SunEvent
 
@@ -18,6 +18,11 @@ class SunEventRepository(ABC):
         """Synchronous version for use in background tasks."""
         pass
 
+    @abstractmethod
+    def get_sun_events_by_dates(self, dates: List[date]) -> Dict[date, SunEvent]:
+        """Get sun events for several dates at once, keyed by date."""
+        pass
+
     @abstractmethod
     async def get_upcoming_sun_events(
         self, from_date: datetime, limit: int = 10
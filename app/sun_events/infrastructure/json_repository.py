@@ -1,6 +1,6 @@
 import json
-from datetime import datetime, time
-from typing import List, Optional
+from datetime import date, datetime, time
+from typing import Dict, List, Optional
 
 from ..domain.entities import SunEvent
 from ..domain.repositories import SunEventRepository
@@ -11,23 +11,28 @@ class JSONSunEventRepository(SunEventRepository):
 
     def __init__(self, config_file: str = "config/sun_events.json"):
         self.config_file = config_file
-        self._cache = None
+        self._events_by_date: Dict[date, SunEvent] = {}
         self._load_data()
 
     def _load_data(self):
-        """Load sun events data from JSON file."""
+        """Load sun events from the JSON file and parse every row once."""
         try:
             with open(self.config_file, "r") as f:
                 data = json.load(f)
-                self._cache = data.get("sun_events", {})
         except FileNotFoundError:
-            self._cache = {}
+            data = {}
         except json.JSONDecodeError:
-            self._cache = {}
+            data = {}
+
+        rows = data.get("sun_events", {})
+        self._events_by_date = {
+            date.fromisoformat(date_str): self._row_to_sun_event(date_str, event_data)
+            for date_str, event_data in sorted(rows.items())
+        }
 
     def _parse_time(self, time_str: str) -> time:
         """Parse time string to time object."""
-        return datetime.strptime(time_str, "%H:%M:%S").time()
+        return time.fromisoformat(time_str)
 
     def _combine_date_time(self, date: datetime, time_str: str) -> datetime:
         """Combine date with time string to create datetime."""
@@ -36,7 +41,7 @@ class JSONSunEventRepository(SunEventRepository):
 
     def _row_to_sun_event(self, date_str: str, event_data: dict) -> SunEvent:
         """Convert JSON data to SunEvent domain entity."""
-        date = datetime.strptime(date_str, "%Y-%m-%d")
+        date = datetime.fromisoformat(date_str)
 
         return SunEvent(
             id=hash(date_str),  # Use hash as simple ID
@@ -86,17 +91,26 @@ class JSONSunEventRepository(SunEventRepository):
             ),
         )
 
+    def _to_date(self, value: date) -> date:
+        """Normalize a date or datetime argument to a date key."""
+        return value.date() if isinstance(value, datetime) else value
+
     async def get_sun_event_by_date(self, date: datetime) -> Optional[SunEvent]:
         """Get sun event for a specific date."""
         return self.get_sun_event_by_date_sync(date)
 
     def get_sun_event_by_date_sync(self, date: datetime) -> Optional[SunEvent]:
         """Synchronous version for use in background tasks."""
-        date_str = date.strftime("%Y-%m-%d")
-
-        if date_str in self._cache:
-            return self._row_to_sun_event(date_str, self._cache[date_str])
-        return None
+        return self._events_by_date.get(self._to_date(date))
+
+    def get_sun_events_by_dates(self, dates: List[date]) -> Dict[date, SunEvent]:
+        """Get sun events for several dates at once, keyed by date."""
+        events = {}
+        for day in dates:
+            event = self._events_by_date.get(self._to_date(day))
+            if event:
+                events[day] = event
+        return events
 
     async def get_upcoming_sun_events(
         self, from_date: datetime, limit: int = 10
@@ -108,29 +122,27 @@ class JSONSunEventRepository(SunEventRepository):
         self, from_date: datetime, limit: int = 10
     ) -> List[SunEvent]:
         """Synchronous version for getting upcoming sun events."""
-        from_date_str = from_date.strftime("%Y-%m-%d")
+        from_day = self._to_date(from_date)
 
+        # Events are stored in date order
         events = []
-        for date_str, event_data in self._cache.items():
-            if date_str >= from_date_str and len(events) < limit:
-                events.append(self._row_to_sun_event(date_str, event_data))
-
-        # Sort by date
-        events.sort(key=lambda x: x.date)
+        for day, event in self._events_by_date.items():
+            if len(events) >= limit:
+                break
+            if day >= from_day:
+                events.append(event)
         return events
 
     async def get_sun_events_in_range(
         self, start_date: datetime, end_date: datetime
     ) -> List[SunEvent]:
         """Get sun events within a date range."""
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-
-        events = []
-        for date_str, event_data in self._cache.items():
-            if start_date_str <= date_str <= end_date_str:
-                events.append(self._row_to_sun_event(date_str, event_data))
-
-        # Sort by date
-        events.sort(key=lambda x: x.date)
-        return events
+        start_day = self._to_date(start_date)
+        end_day = self._to_date(end_date)
+
+        # Events are stored in date order
+        return [
+            event
+            for day, event in self._events_by_date.items()
+            if start_day <= day <= end_day
+        ]
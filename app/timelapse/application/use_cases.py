@@ -1,10 +1,19 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-
+from datetime import date, datetime
+from functools import lru_cache
+
+from ...sun_events.application.use_cases import (
+    MIDNIGHT,
+    build_sunrise_period,
+    build_sunset_period,
+)
 from ...sun_events.domain.repositories import SunEventRepository
 from ..domain.entities import TimelapseParameters
 from ..domain.calculator import TimelapseCalculator
 
+# Distinct request/day combinations kept per use case
+TIMELAPSE_CACHE_SIZE = 128
+
 
 @dataclass
 class CalculateTimelapseRequest:
@@ -29,6 +38,10 @@ class CalculateTimelapseUseCase:
     def __init__(self, sun_event_repository: SunEventRepository):
         self.sun_event_repository = sun_event_repository
         self.timelapse_calculator = TimelapseCalculator()
+        # Keyed by the request fields and the day, so results roll over daily
+        self._calculate_for_day = lru_cache(maxsize=TIMELAPSE_CACHE_SIZE)(
+            self._calculate_parameters
+        )
 
     def execute(self, request: CalculateTimelapseRequest) -> CalculateTimelapseResponse:
         """Execute the use case."""
@@ -41,33 +54,46 @@ class CalculateTimelapseUseCase:
         ):
             raise ValueError("Invalid video parameters")
 
-        # Get today's sun event
-        today = datetime.now().date()
+        timelapse_parameters = self._calculate_for_day(
+            request.period_type,
+            request.video_duration_seconds,
+            request.video_fps,
+            request.photo_size_mb,
+            datetime.now().date(),
+        )
+
+        return CalculateTimelapseResponse(timelapse_parameters=timelapse_parameters)
+
+    def _calculate_parameters(
+        self,
+        period_type: str,
+        video_duration_seconds: int,
+        video_fps: int,
+        photo_size_mb: float,
+        day: date,
+    ) -> TimelapseParameters:
+        """Calculate timelapse parameters for a period on the given day."""
         sun_event = self.sun_event_repository.get_sun_event_by_date_sync(
-            datetime.combine(today, datetime.min.time())
+            datetime.combine(day, MIDNIGHT)
         )
 
         if not sun_event:
             raise ValueError("No sun event data available for today")
 
         # Determine start and end times based on period type
-        if request.period_type.lower() == "sunrise":
-            start_time = sun_event.golden_hour_morning_start
-            end_time = sun_event.golden_hour_morning_end + timedelta(minutes=30)
-        elif request.period_type.lower() == "sunset":
-            start_time = sun_event.golden_hour_evening_start - timedelta(minutes=30)
-            end_time = sun_event.dusk
+        if period_type.lower() == "sunrise":
+            period = build_sunrise_period(sun_event)
+        elif period_type.lower() == "sunset":
+            period = build_sunset_period(sun_event)
         else:
             raise ValueError("Period type must be 'sunrise' or 'sunset'")
 
         # Calculate timelapse parameters using domain service
-        timelapse_parameters = self.timelapse_calculator.calculate_parameters(
-            period_type=request.period_type,
-            start_time=start_time,
-            end_time=end_time,
-            video_duration_seconds=request.video_duration_seconds,
-            video_fps=request.video_fps,
-            photo_size_mb=request.photo_size_mb,
+        return self.timelapse_calculator.calculate_parameters(
+            period_type=period_type,
+            start_time=period.start_time,
+            end_time=period.end_time,
+            video_duration_seconds=video_duration_seconds,
+            video_fps=video_fps,
+            photo_size_mb=photo_size_mb,
         )
-
-        return CalculateTimelapseResponse(timelapse_parameters=timelapse_parameters)
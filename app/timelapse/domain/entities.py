@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelapseParameters:
     """Domain entity representing timelapse parameters for a sun event period."""
 
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import shlex
 from pathlib import Path
 
 
@@ -43,9 +44,15 @@ class FFmpegVideoProcessor:
             output_path = Path(output_video_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
+            # Write the file list off the event loop, it can list thousands of
+            # photos on slow storage
+            file_list_path = await asyncio.to_thread(
+                self._create_file_list, image_files
+            )
+
             # Build FFmpeg command
             cmd = self._build_ffmpeg_command(
-                image_files, output_video_path, fps, quality
+                file_list_path, output_video_path, fps, quality
             )
 
             # Execute FFmpeg command
@@ -63,12 +70,9 @@ class FFmpegVideoProcessor:
             return False
 
     def _build_ffmpeg_command(
-        self, image_files: list, output_path: str, fps: int, quality: str
+        self, file_list_path: Path, output_path: str, fps: int, quality: str
     ) -> list:
         """Build FFmpeg command for video creation."""
-        # Create a file list for FFmpeg
-        file_list_path = self._create_file_list(image_files)
-
         # Build command
         cmd = [
             self.ffmpeg_path,
@@ -102,35 +106,41 @@ class FFmpegVideoProcessor:
         """Create a file list for FFmpeg concat demuxer."""
         file_list_path = Path("/tmp/ffmpeg_file_list.txt")
 
+        # Format: file 'path/to/image.jpg', followed by the frame duration
+        # (0.1 seconds per frame)
+        file_list = "".join(
+            f"file '{image_file.absolute()}'\nduration 0.1\n"
+            for image_file in image_files
+        )
         with open(file_list_path, "w") as f:
-            for image_file in image_files:
-                # Format: file 'path/to/image.jpg'
-                f.write(f"file '{image_file.absolute()}'\n")
-                # Add duration for each frame
-                f.write("duration 0.1\n")  # 0.1 seconds per frame
+            f.write(file_list)
 
         return file_list_path
 
     async def _execute_ffmpeg_command(self, cmd: list) -> bool:
         """Execute FFmpeg command asynchronously."""
         try:
-            self.logger.info(f"Executing FFmpeg command: {' '.join(cmd)}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Executing FFmpeg command: {shlex.join(cmd)}")
 
-            # Run FFmpeg process
+            # Run FFmpeg process; only stderr is read (on failure), so stdout
+            # is discarded instead of buffered
             process = await asyncio.create_subprocess_exec(
                 *cmd,
-                stdout=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE,
             )
 
             # Wait for completion
-            stdout, stderr = await process.communicate()
+            _, stderr = await process.communicate()
 
             if process.returncode == 0:
                 self.logger.info("FFmpeg command completed successfully")
                 return True
             else:
-                self.logger.error(f"FFmpeg command failed: {stderr.decode()}")
+                self.logger.error(
+                    f"FFmpeg command failed: {stderr.decode(errors='replace')}"
+                )
                 return False
 
         except Exception as e:
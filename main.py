@@ -22,6 +22,15 @@ from app.video_processing.infrastructure.ffmpeg_video_processor import (
     FFmpegVideoProcessor,
 )
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional, fall back to the default event loop
+    uvloop = None
+
+# Event loop used by the background monitor thread. uvicorn picks uvloop on
+# its own when it is installed (loop="auto").
+EVENT_LOOP_FACTORY = uvloop.new_event_loop if uvloop else None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -70,7 +79,7 @@ async def lifespan(app: FastAPI):
 
     # Start background service in separate thread
     def run_background_service():
-        asyncio.run(monitor_service.start())
+        asyncio.run(monitor_service.start(), loop_factory=EVENT_LOOP_FACTORY)
 
     monitor_thread = threading.Thread(target=run_background_service, daemon=True)
     monitor_thread.start()
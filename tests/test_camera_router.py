@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.api.infrastructure import camera_router  # noqa: E402
+
+
+def test_live_view_stream_rejects_invalid_settings(monkeypatch):
+    """Test that out-of-range stream settings are a 400, not a server error."""
+    streams = []
+    container = SimpleNamespace(
+        camera_service=object(),
+        camera_config=None,
+        image_config=None,
+        live_view_frames=lambda *args: streams.append(args),
+    )
+    monkeypatch.setattr(camera_router, "get_camera_container", lambda: container)
+    app = FastAPI()
+    app.include_router(camera_router.create_camera_router())
+    client = TestClient(app)
+
+    for params in ({"framerate": 10.0}, {"framerate": 0}, {"quality": 0}):
+        response = client.get("/camera/live-view/stream", params=params)
+
+        assert response.status_code == 400
+
+    assert streams == []
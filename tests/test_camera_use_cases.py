@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.camera.application.use_cases import (
+    ExecuteCommandRequest,
+    ExecuteCommandUseCase,
+    StartLiveViewStreamRequest,
+    TakeLiveViewSnapshotRequest,
+    TakeLiveViewSnapshotUseCase,
+)
+from app.camera.domain.entities import (
+    AutoShootParams,
+    CameraShootingResult,
+    LiveViewResult,
+    build_shooting_id,
+)
+
+
+class RecordingCameraService:
+    """Camera service stub that records the commands it receives."""
+
+    def __init__(self):
+        self.commands = []
+
+    async def execute_command(self, command):
+        self.commands.append(command)
+        return CameraShootingResult(success=True, message="ok")
+
+    async def take_live_view_snapshot(self, include_overlay: bool = True):
+        self.commands.append("snapshot")
+        await asyncio.sleep(0.01)
+        return LiveViewResult(success=True, message="ok", image_data=b"jpeg")
+
+
+def test_execute_command_builds_typed_parameters():
+    """Test that command parameters are converted to the command's type."""
+    service = RecordingCameraService()
+    use_case = ExecuteCommandUseCase(service)
+
+    response = asyncio.run(
+        use_case.execute(
+            ExecuteCommandRequest(command_type="auto_shoot", parameters={"shots": 5})
+        )
+    )
+
+    assert response.success is True
+    assert service.commands[0].parameters == AutoShootParams(shots=5)
+
+
+def test_execute_command_rejects_unknown_parameters():
+    """Test that parameters not accepted by the command fail validation."""
+    service = RecordingCameraService()
+    use_case = ExecuteCommandUseCase(service)
+
+    response = asyncio.run(
+        use_case.execute(
+            ExecuteCommandRequest(command_type="burst_shoot", parameters={"delay": 1})
+        )
+    )
+
+    assert response.success is False
+    assert response.message == "Invalid parameters for burst_shoot: delay"
+    assert service.commands == []
+
+
+def test_execute_command_rejects_unknown_command_type():
+    """Test that an unknown command is an unsuccessful response, not an error."""
+    service = RecordingCameraService()
+    use_case = ExecuteCommandUseCase(service)
+
+    response = asyncio.run(
+        use_case.execute(ExecuteCommandRequest(command_type="zoom", parameters={}))
+    )
+
+    assert response.success is False
+    assert response.message == "Invalid command type: zoom"
+    assert service.commands == []
+
+
+def test_stream_requests_validate_on_construction():
+    """Test that invalid stream requests are rejected up front."""
+    with pytest.raises(ValueError, match="cannot exceed 8.0 FPS"):
+        StartLiveViewStreamRequest(framerate=10.0)
+
+    with pytest.raises(ValueError, match="Quality must be between 1 and 100"):
+        StartLiveViewStreamRequest(quality=0)
+
+
+def test_concurrent_snapshots_share_one_capture():
+    """Test that overlapping snapshot requests are served by one capture."""
+    service = RecordingCameraService()
+    use_case = TakeLiveViewSnapshotUseCase(service)
+
+    async def run():
+        first = await asyncio.gather(
+            *(use_case.execute(TakeLiveViewSnapshotRequest()) for _ in range(3))
+        )
+        second = await use_case.execute(TakeLiveViewSnapshotRequest())
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert all(response.image_data == b"jpeg" for response in first)
+    assert second.success is True
+    assert service.commands == ["snapshot", "snapshot"]
+
+
+def test_unexpected_service_errors_become_failed_responses():
+    """Test that errors outside CAMERA_ERRORS are still reported as failures."""
+
+    class BrokenCameraService(RecordingCameraService):
+        async def take_live_view_snapshot(self, include_overlay: bool = True):
+            raise RuntimeError("encoder crashed")
+
+    use_case = TakeLiveViewSnapshotUseCase(BrokenCameraService())
+
+    response = asyncio.run(use_case.execute(TakeLiveViewSnapshotRequest()))
+
+    assert response.success is False
+    assert response.message == "Error taking live view snapshot: encoder crashed"
+
+
+def test_build_shooting_id():
+    """Test the shooting ID format shared by both camera services."""
+    now = datetime(2025, 6, 28, 6, 7, 54)
+
+    assert build_shooting_id("burst_shoot", now) == "burst_shoot_20250628_060754"
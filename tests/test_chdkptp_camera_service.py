@@ -0,0 +1,39 @@
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from app.camera.domain.entities import BurstShootParams  # noqa: E402
+from app.camera.infrastructure.chdkptp_camera_service import (  # noqa: E402
+    CHDKPTPCameraService,
+    CommandResult,
+)
+
+
+class LegacyCameraService(CHDKPTPCameraService):
+    """The legacy service never implemented manual shooting."""
+
+    async def manual_shoot(self, parameters):
+        raise NotImplementedError
+
+
+def test_shoot_series_reports_only_new_images(tmp_path, monkeypatch):
+    """Test that images left over from earlier runs are not counted."""
+    for mtime, name in enumerate(["old1.jpg", "old2.jpg", "old3.jpg"], start=1):
+        (tmp_path / name).touch()
+        os.utime(tmp_path / name, (mtime, mtime))
+    service = LegacyCameraService(str(tmp_path), str(tmp_path), use_sudo=False)
+
+    async def shoot(cmd):
+        (tmp_path / "new1.jpg").touch()
+        return CommandResult(0, b"", b"")
+
+    monkeypatch.setattr(service, "_run_chdkptp_command", shoot)
+
+    result = asyncio.run(service._execute_burst_shoot(BurstShootParams(shots=3)))
+
+    assert result.success is True
+    assert result.message == "Burst shoot completed: 1/3 shots taken"
+    assert result.image_path == str(tmp_path / "new1.jpg")
@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from app.camera.domain.entities import (  # noqa: E402
+    LiveViewResult,
+    LiveViewStream,
+    Result,
+)
+from app.camera.infrastructure.container import CameraContainer  # noqa: E402
+
+
+class StreamingCameraService:
+    """Camera service whose live view records the configurations it started with."""
+
+    def __init__(self):
+        self.configs = []
+
+    async def start_live_view_stream(self, config):
+        self.configs.append(config)
+        while True:
+            yield LiveViewResult(
+                success=True,
+                message="frame",
+                image_data=b"jpeg",
+                timestamp=datetime.now(),
+            )
+            await asyncio.sleep(0.01)
+
+
+def _create_container():
+    container = CameraContainer()
+    camera = StreamingCameraService()
+    container._camera_service = camera
+    return container, camera
+
+
+async def _read_frames(frames, count):
+    received = 0
+    async for result in frames:
+        received += 1
+        if received == count:
+            break
+    return received
+
+
+def test_live_view_clients_share_one_hub():
+    """Test that clients with different settings share the camera's one stream."""
+    container, camera = _create_container()
+
+    async def run():
+        await asyncio.gather(
+            _read_frames(container.live_view_frames(5.0, 80), 3),
+            _read_frames(container.live_view_frames(2.0, 50), 3),
+        )
+
+    asyncio.run(run())
+
+    assert camera.configs == [LiveViewStream(framerate=5.0, quality=80)]
+    assert container._live_view_hub is None
+
+
+def test_live_view_rejects_invalid_settings():
+    """Test that an invalid stream configuration is rejected before streaming."""
+    container, _ = _create_container()
+
+    with pytest.raises(ValueError):
+        container.live_view_frames(10.0, 80)
+
+
+def test_reload_stops_running_live_view(monkeypatch):
+    """Test that reloading the configuration ends the running capture loop."""
+    container, _ = _create_container()
+    monkeypatch.setattr(
+        container._config_service,
+        "reload_configuration",
+        lambda: Result.success(None),
+    )
+
+    async def run():
+        frames = container.live_view_frames(5.0, 80)
+        assert await _read_frames(frames, 1) == 1
+        hub = container._live_view_hub
+        # Keep a client subscribed while the configuration is reloaded
+        client = asyncio.create_task(_read_frames(frames, 1000))
+        await asyncio.sleep(0.02)
+
+        assert container.reload_configuration() is True
+        await asyncio.gather(*container._pending_closes)
+        await asyncio.wait_for(client, timeout=1)
+        return hub
+
+    hub = asyncio.run(run())
+
+    assert not hub.is_running
+    assert container._live_view_hub is None
@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("cv2")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.api.infrastructure.fastapi_app import create_app  # noqa: E402
+from app.camera.infrastructure.error_handling_service import (  # noqa: E402
+    get_error_handling_service,
+)
+from app.timelapse.application.use_cases import CalculateTimelapseUseCase  # noqa: E402
+
+
+def test_timelapse_failure_is_recorded_with_request_data(monkeypatch):
+    """Test that the global handler records the /timelapse request body."""
+    recorded = []
+    monkeypatch.setattr(
+        get_error_handling_service(),
+        "record_error",
+        lambda *args, **kwargs: recorded.append(kwargs["context"]),
+    )
+
+    def fail(self, request):
+        raise RuntimeError("sun event data unavailable")
+
+    monkeypatch.setattr(CalculateTimelapseUseCase, "execute", fail)
+    client = TestClient(create_app(), raise_server_exceptions=False)
+
+    response = client.post(
+        "/timelapse", json={"period_type": "sunset", "video_fps": 30}
+    )
+
+    assert response.status_code == 500
+    assert recorded == [
+        {
+            "endpoint": "/timelapse",
+            "request_data": {
+                "period_type": "sunset",
+                "video_duration_seconds": 20,
+                "video_fps": 30,
+                "photo_size_mb": 10.0,
+            },
+        }
+    ]
@@ -0,0 +1,74 @@
+import asyncio
+import os
+
+from app.camera.infrastructure.file_management_service import (
+    LocalFileManagementService,
+)
+
+
+def _make_images(directory, names):
+    """Create files whose modification times follow the order of names."""
+    for mtime, name in enumerate(names, start=1):
+        path = directory / name
+        path.touch()
+        os.utime(path, (mtime, mtime))
+
+
+def test_image_listing_is_newest_first(tmp_path):
+    """Test that images are listed newest first and other files are skipped."""
+    _make_images(tmp_path, ["a.jpg", "b.CR2", "notes.txt", "c.jpeg"])
+    (tmp_path / "d.jpg").mkdir()
+    service = LocalFileManagementService(str(tmp_path))
+
+    listing = asyncio.run(service.list_image_files(str(tmp_path)))
+    newest = asyncio.run(service.list_image_files(str(tmp_path), limit=2))
+    latest = asyncio.run(service.get_latest_image(str(tmp_path)))
+
+    assert listing == [str(tmp_path / name) for name in ("c.jpeg", "b.CR2", "a.jpg")]
+    assert newest == listing[:2]
+    assert latest == str(tmp_path / "c.jpeg")
+
+
+def test_image_listing_of_missing_directory(tmp_path):
+    """Test that a missing directory yields no images instead of an error."""
+    service = LocalFileManagementService(str(tmp_path))
+    missing = str(tmp_path / "missing")
+
+    assert asyncio.run(service.list_image_files(missing)) == []
+    assert asyncio.run(service.get_latest_image(missing)) is None
+
+
+def test_image_listing_is_cached_until_directory_changes(tmp_path):
+    """Test that the scan is reused while the directory mtime is unchanged."""
+    _make_images(tmp_path, ["a.jpg"])
+    os.utime(tmp_path, (100, 100))
+    service = LocalFileManagementService(str(tmp_path))
+
+    assert asyncio.run(service.list_image_files(str(tmp_path))) == [
+        str(tmp_path / "a.jpg")
+    ]
+
+    # A new image with the directory mtime forced back is not seen...
+    _make_images(tmp_path, ["a.jpg", "b.jpg"])
+    os.utime(tmp_path, (100, 100))
+    assert asyncio.run(service.get_latest_image(str(tmp_path))) == str(
+        tmp_path / "a.jpg"
+    )
+
+    # ...until the directory changes
+    os.utime(tmp_path, (200, 200))
+    assert asyncio.run(service.get_latest_image(str(tmp_path))) == str(
+        tmp_path / "b.jpg"
+    )
+
+
+def test_image_listing_skips_thumbnail_cache(tmp_path):
+    """Test that cached thumbnails and other hidden entries are not listed."""
+    _make_images(tmp_path, ["a.jpg", ".hidden.jpg"])
+    (tmp_path / ".thumbnails").mkdir()
+    _make_images(tmp_path / ".thumbnails", ["a.jpg.thumb.jpg"])
+    service = LocalFileManagementService(str(tmp_path))
+
+    assert asyncio.run(service.list_image_files(str(tmp_path))) == [
+        str(tmp_path / "a.jpg")
+    ]
@@ -0,0 +1,95 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.api.infrastructure import camera_router  # noqa: E402
+from app.camera.domain.entities import ImageProcessingConfiguration  # noqa: E402
+from app.camera.infrastructure.file_management_service import (  # noqa: E402
+    LocalFileManagementService,
+)
+from app.camera.infrastructure.image_processing_service import (  # noqa: E402
+    OpenCVImageProcessingService,
+)
+
+
+def _write_image(path, width=4000, height=3000, mtime=100):
+    """Write a solid JPEG with a fixed modification time."""
+    cv2.imwrite(str(path), np.full((height, width, 3), 128, np.uint8))
+    os.utime(path, (mtime, mtime))
+
+
+def test_thumbnail_is_cached_in_subdirectory(tmp_path):
+    """Test that the thumbnail is written once to the cache and then reused."""
+    image_path = tmp_path / "IMG_0001.JPG"
+    _write_image(image_path)
+    service = OpenCVImageProcessingService(ImageProcessingConfiguration())
+
+    thumbnail_path = asyncio.run(service.get_thumbnail(str(image_path)))
+
+    assert thumbnail_path == str(tmp_path / ".thumbnails" / "IMG_0001.JPG.thumb.jpg")
+    assert cv2.imread(thumbnail_path).shape[1] == service.THUMBNAIL_MAX_WIDTH
+
+    written = []
+    service._write_thumbnail = lambda *args: written.append(args) or True
+    assert asyncio.run(service.get_thumbnail(str(image_path))) == thumbnail_path
+    assert written == []
+
+
+def test_thumbnail_is_regenerated_for_newer_image(tmp_path):
+    """Test that a thumbnail older than its image is rebuilt."""
+    image_path = tmp_path / "IMG_0001.JPG"
+    _write_image(image_path)
+    service = OpenCVImageProcessingService(ImageProcessingConfiguration())
+    thumbnail_path = asyncio.run(service.get_thumbnail(str(image_path)))
+    os.utime(thumbnail_path, (100, 100))
+
+    _write_image(image_path, width=1280, height=960, mtime=200)
+
+    assert asyncio.run(service.get_thumbnail(str(image_path))) == thumbnail_path
+    assert cv2.imread(thumbnail_path).shape[:2] == (480, 640)
+    assert os.listdir(tmp_path / ".thumbnails") == ["IMG_0001.JPG.thumb.jpg"]
+
+
+def test_small_image_thumbnail_keeps_its_size(tmp_path):
+    """Test that images narrower than the target are not shrunk further."""
+    image_path = tmp_path / "IMG_0001.JPG"
+    _write_image(image_path, width=400, height=300)
+    service = OpenCVImageProcessingService(ImageProcessingConfiguration())
+
+    thumbnail_path = asyncio.run(service.get_thumbnail(str(image_path)))
+
+    assert cv2.imread(thumbnail_path).shape[:2] == (300, 400)
+
+
+def test_last_picture_thumbnail_route(tmp_path, monkeypatch):
+    """Test that size=thumb serves the cached thumbnail of the latest image."""
+    _write_image(tmp_path / "IMG_0001.JPG", mtime=100)
+    _write_image(tmp_path / "IMG_0002.JPG", mtime=200)
+    container = SimpleNamespace(
+        file_service=LocalFileManagementService(str(tmp_path)),
+        camera_config=SimpleNamespace(output_directory=str(tmp_path)),
+        image_service=OpenCVImageProcessingService(ImageProcessingConfiguration()),
+    )
+    monkeypatch.setattr(camera_router, "get_camera_container", lambda: container)
+    app = FastAPI()
+    app.include_router(camera_router.create_camera_router())
+    client = TestClient(app)
+
+    thumb = client.get("/camera/last-picture", params={"size": "thumb"})
+    full = client.get("/camera/last-picture")
+
+    assert thumb.status_code == 200
+    assert thumb.headers["content-type"] == "image/jpeg"
+    assert (
+        thumb.content
+        == (tmp_path / ".thumbnails" / "IMG_0002.JPG.thumb.jpg").read_bytes()
+    )
+    assert full.content == (tmp_path / "IMG_0002.JPG").read_bytes()
@@ -0,0 +1,110 @@
+import asyncio
+
+from app.camera.domain.entities import LiveViewResult
+from app.camera.infrastructure.live_view_frame_hub import LiveViewFrameHub
+
+
+def test_frame_hub_shares_one_capture_loop_between_clients():
+    """Test that several clients are served from a single camera stream."""
+    started_streams = []
+
+    async def camera_stream():
+        started_streams.append(True)
+        frame = 0
+        while True:
+            frame += 1
+            yield LiveViewResult(
+                success=True, message=f"Frame {frame}", image_data=b"jpeg"
+            )
+            await asyncio.sleep(0.01)
+
+    async def read_frames(hub: LiveViewFrameHub, count: int) -> list:
+        received = []
+        async for result in hub.frames():
+            received.append(result)
+            if len(received) == count:
+                break
+        return received
+
+    async def run():
+        hub = LiveViewFrameHub(camera_stream)
+        first, second = await asyncio.gather(read_frames(hub, 3), read_frames(hub, 3))
+        await asyncio.sleep(0)
+        return hub, first, second
+
+    hub, first, second = asyncio.run(run())
+
+    assert len(started_streams) == 1
+    assert len(first) == 3
+    assert len(second) == 3
+    assert hub.subscriber_count == 0
+    assert not hub.is_running
+
+
+def test_frame_hub_stops_clients_on_failed_frame():
+    """Test that a failed frame is delivered and ends every client stream."""
+
+    async def camera_stream():
+        yield LiveViewResult(success=False, message="Camera not connected")
+
+    async def run():
+        hub = LiveViewFrameHub(camera_stream)
+        return [result async for result in hub.frames()]
+
+    received = asyncio.run(run())
+
+    assert len(received) == 1
+    assert received[0].success is False
+    assert received[0].message == "Camera not connected"
+
+
+def test_frame_hub_reports_capture_loop_errors():
+    """Test that an exception in the capture loop reaches clients as a failure."""
+
+    async def camera_stream():
+        yield LiveViewResult(success=True, message="Frame 1", image_data=b"jpeg")
+        await asyncio.sleep(0.01)
+        raise RuntimeError("camera unplugged")
+
+    async def run():
+        hub = LiveViewFrameHub(camera_stream)
+        return hub, [result async for result in hub.frames()]
+
+    hub, received = asyncio.run(run())
+
+    assert [result.success for result in received] == [True, False]
+    assert received[-1].message == "Live view capture failed: camera unplugged"
+    assert not hub.is_running
+
+
+def test_frame_hub_starts_with_first_client_config_and_reports_idle():
+    """Test that the first client's arguments start capture for everyone."""
+    configs = []
+    idle_hubs = []
+
+    async def camera_stream(config):
+        configs.append(config)
+        while True:
+            yield LiveViewResult(success=True, message=config, image_data=b"jpeg")
+            await asyncio.sleep(0.01)
+
+    async def read_frames(hub: LiveViewFrameHub, config: str) -> list:
+        received = []
+        async for result in hub.frames(config):
+            received.append(result.message)
+            if len(received) == 2:
+                break
+        return received
+
+    async def run():
+        hub = LiveViewFrameHub(camera_stream, on_idle=idle_hubs.append)
+        first, second = await asyncio.gather(
+            read_frames(hub, "first"), read_frames(hub, "second")
+        )
+        return hub, first, second
+
+    hub, first, second = asyncio.run(run())
+
+    assert configs == ["first"]
+    assert first == second == ["first", "first"]
+    assert idle_hubs == [hub]
@@ -0,0 +1,116 @@
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from app.camera.domain.entities import (  # noqa: E402
+    AutoShootParams,
+    CameraConfiguration,
+    ImageProcessingConfiguration,
+    LiveViewStream,
+)
+from app.camera.infrastructure.file_management_service import (  # noqa: E402
+    LocalFileManagementService,
+)
+from app.camera.infrastructure.image_processing_service import (  # noqa: E402
+    OpenCVImageProcessingService,
+)
+from app.camera.infrastructure.refactored_camera_service import (  # noqa: E402
+    RefactoredCHDKPTPCameraService,
+)
+
+
+class ShootingSubprocessService:
+    """Subprocess service whose chdkptp run writes a fixed set of images."""
+
+    def __init__(self, output_directory, new_images):
+        self.output_directory = output_directory
+        self.new_images = new_images
+
+    async def validate_executable(self, executable_path):
+        return True
+
+    async def execute_chdkptp_command(self, arguments):
+        for name in self.new_images:
+            (self.output_directory / name).touch()
+        return True, "", ""
+
+
+def _create_service(tmp_path, new_images):
+    config = CameraConfiguration(
+        chdkptp_location=str(tmp_path), output_directory=str(tmp_path)
+    )
+    return RefactoredCHDKPTPCameraService(
+        ShootingSubprocessService(tmp_path, new_images),
+        OpenCVImageProcessingService(ImageProcessingConfiguration()),
+        LocalFileManagementService(str(tmp_path)),
+        config,
+    )
+
+
+def test_shoot_series_reports_only_new_images(tmp_path):
+    """Test that images left over from earlier runs are not counted."""
+    for mtime, name in enumerate(["old1.jpg", "old2.jpg", "old3.jpg"], start=1):
+        (tmp_path / name).touch()
+        os.utime(tmp_path / name, (mtime, mtime))
+    os.utime(tmp_path, (100, 100))
+    service = _create_service(tmp_path, ["new1.jpg"])
+
+    result = asyncio.run(service._execute_auto_shoot(AutoShootParams(shots=3)))
+
+    assert result.success is True
+    assert result.message == "Auto shoot completed: 1/3 shots taken"
+    assert result.image_path == str(tmp_path / "new1.jpg")
+
+
+def test_shoot_series_without_new_images_fails(tmp_path):
+    """Test that a run that took no pictures is not reported as a success."""
+    (tmp_path / "old.jpg").touch()
+    service = _create_service(tmp_path, [])
+
+    result = asyncio.run(service._execute_auto_shoot(AutoShootParams(shots=2)))
+
+    assert result.success is False
+    assert result.message == "Auto shoot completed: 0/2 shots taken"
+    assert result.image_path is None
+
+
+class FrameImageService:
+    """Image service that turns every live view dump into the same JPEG."""
+
+    async def read_ppm_image(self, file_path):
+        return b"ppm"
+
+    async def add_timestamp_overlay(self, image_data):
+        return b"jpeg"
+
+
+def test_finishing_stream_does_not_stop_newer_stream(tmp_path):
+    """Test that closing an old live view stream leaves the current one running."""
+    config = CameraConfiguration(
+        chdkptp_location=str(tmp_path), output_directory=str(tmp_path)
+    )
+    service = RefactoredCHDKPTPCameraService(
+        ShootingSubprocessService(tmp_path, []),
+        FrameImageService(),
+        LocalFileManagementService(str(tmp_path)),
+        config,
+    )
+    stream_config = LiveViewStream(framerate=8.0)
+
+    async def run():
+        old = service.start_live_view_stream(stream_config)
+        await old.__anext__()
+        new = service.start_live_view_stream(stream_config)
+        await new.__anext__()
+        await old.aclose()
+        frame = await new.__anext__()
+        await new.aclose()
+        return frame
+
+    frame = asyncio.run(run())
+
+    assert frame.success is True
+    assert service._streaming is False
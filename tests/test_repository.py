@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from app.sun_events.infrastructure.json_repository import JSONSunEventRepository
 
@@ -58,3 +58,14 @@ def test_repository_upcoming_events():
     # Should find events for the current day and future days
     expected_date = datetime(2025, 6, 28)
     assert any(event.date == expected_date for event in upcoming)
+
+
+def test_repository_events_by_dates():
+    """Test that the repository returns events for several dates, skipping gaps."""
+    repository = JSONSunEventRepository()
+
+    dates = [date(2025, 6, 27), date(2025, 6, 28), date(2025, 6, 29)]
+    events = repository.get_sun_events_by_dates(dates)
+
+    assert list(events) == [date(2025, 6, 28), date(2025, 6, 29)]
+    assert events[date(2025, 6, 28)].date == datetime(2025, 6, 28)
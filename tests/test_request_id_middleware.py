@@ -0,0 +1,51 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.infrastructure.request_id_middleware import (
+    RequestIDMiddleware,
+    get_request_id,
+)
+
+
+def create_test_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestIDMiddleware, generate_request_id=lambda: "generated")
+
+    @app.get("/request-id")
+    async def read_request_id():
+        return {"request_id": get_request_id()}
+
+    return TestClient(app)
+
+
+def test_request_id_is_generated_and_echoed():
+    """Test that a generated request ID is visible to handlers and the client."""
+    response = create_test_client().get("/request-id")
+
+    assert response.json() == {"request_id": "generated"}
+    assert response.headers["X-Request-ID"] == "generated"
+
+
+def test_client_request_id_is_reused():
+    """Test that the client's X-Request-ID is reused instead of generating one."""
+    response = create_test_client().get(
+        "/request-id", headers={"X-Request-ID": "client-id"}
+    )
+
+    assert response.json() == {"request_id": "client-id"}
+    assert response.headers["X-Request-ID"] == "client-id"
+    assert get_request_id() == "unknown"
+
+
+def test_invalid_client_request_id_is_replaced():
+    """Test that oversized or unsafe client request IDs are not reused."""
+    client = create_test_client()
+
+    for request_id in ("x" * 129, "bad id\x01", "id;rm"):
+        response = client.get("/request-id", headers={"X-Request-ID": request_id})
+
+        assert response.json() == {"request_id": "generated"}
+        assert response.headers["X-Request-ID"] == "generated"
+
+    response = client.get("/request-id", headers={"X-Request-ID": "a" * 128})
+    assert response.json() == {"request_id": "a" * 128}
@@ -0,0 +1,261 @@
+import asyncio
+import threading
+
+from app.camera.infrastructure.subprocess_service import (
+    CHDKPTPSubprocessService,
+    quote_chdkptp_argument,
+)
+
+
+def test_chdkptp_script_is_checked_until_found(tmp_path):
+    """Test that a missing script is re-checked and a found one is remembered."""
+    service = CHDKPTPSubprocessService(str(tmp_path))
+    script = tmp_path / "chdkptp.sh"
+
+    assert asyncio.run(service.validate_executable("chdkptp.sh")) is False
+
+    script.touch()
+    assert asyncio.run(service.validate_executable("chdkptp.sh")) is True
+
+    script.unlink()
+    command = asyncio.run(service.build_chdkptp_command(["-ec"]))
+    assert command == ["sudo", str(script), "-ec"]
+
+
+def test_chdkptp_command_without_sudo(tmp_path):
+    """Test that chdkptp.sh is run directly when sudo is disabled."""
+    script = tmp_path / "chdkptp.sh"
+    script.touch()
+    service = CHDKPTPSubprocessService(str(tmp_path), use_sudo=False)
+
+    command = asyncio.run(service.build_chdkptp_command(["-ec", "-erec"]))
+
+    assert command == [str(script), "-ec", "-erec"]
+    assert asyncio.run(service.build_chdkptp_command(command)) == command
+
+
+def test_quote_chdkptp_argument():
+    """Test that paths are quoted so chdkptp keeps them as one argument."""
+    assert quote_chdkptp_argument("/home/pi/My Images") == '"/home/pi/My Images"'
+    assert quote_chdkptp_argument('a"b\\c') == '"a\\"b\\\\c"'
+
+
+class FakeSession:
+    """Interactive chdkptp stand-in that answers each command with a prompt."""
+
+    def __init__(self, responses=None, broken=False, hangs_on=()):
+        self.responses = responses or {}
+        self.broken = broken
+        self.hangs_on = hangs_on
+        self.commands = []
+        self.returncode = None
+        self.stdin = self
+        self.stdout = asyncio.StreamReader()
+        self.stdout.feed_data(b"chdkptp banner\n___> ")
+
+    def write(self, data: bytes) -> None:
+        if self.broken:
+            raise BrokenPipeError("chdkptp exited")
+        command = data.decode().strip()
+        self.commands.append(command)
+        if command == "quit":
+            self.returncode = 0
+            return
+        if command in self.hangs_on:
+            return
+        prompt = b"___> " if command == "dis" else b"con> "
+        self.stdout.feed_data(self.responses.get(command, b"") + prompt)
+
+    async def drain(self) -> None:
+        pass
+
+    async def wait(self) -> int:
+        return self.returncode
+
+    def kill(self) -> None:
+        self.returncode = -9
+
+
+def _session_service(tmp_path, monkeypatch, sessions, command_timeout=30):
+    """Build a persistent-session service that starts the given fake sessions."""
+    (tmp_path / "chdkptp.sh").touch()
+    service = CHDKPTPSubprocessService(
+        str(tmp_path), persistent_session=True, command_timeout=command_timeout
+    )
+    started = []
+
+    async def create_subprocess_exec(*command, **kwargs):
+        session = sessions[len(started)]()
+        started.append(session)
+        return session
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+    return service, started
+
+
+def test_arguments_to_session_commands_keep_connection_open():
+    """Test that connect/disconnect arguments are dropped in session mode."""
+    commands = CHDKPTPSubprocessService._arguments_to_session_commands(
+        ["-c", "-ec", "-erec", '-ers "/a b" -shots=2', "-eplay", "-edisconnect"]
+    )
+
+    assert commands == ["rec", 'rs "/a b" -shots=2', "play"]
+
+
+def test_read_until_prompt_strips_prompt_across_chunks():
+    """Test that output is read until a prompt split over several reads."""
+
+    async def run():
+        session = FakeSession()
+        await CHDKPTPSubprocessService._read_until_prompt(None, session)
+        session.stdout.feed_data(b"rs to icon> dir\nco")
+        session.stdout.feed_data(b"n> ")
+        return await CHDKPTPSubprocessService._read_until_prompt(None, session)
+
+    assert asyncio.run(run()) == "rs to icon> dir\n"
+
+
+def test_session_connects_once_and_reuses_process(tmp_path, monkeypatch):
+    """Test that commands share one connected process."""
+    service, started = _session_service(tmp_path, monkeypatch, [FakeSession])
+    arguments = ["-ec", "-erec", "-ers /images", "-eplay", "-edisconnect"]
+
+    async def run():
+        first = await service.execute_chdkptp_command(arguments)
+        second = await service.execute_chdkptp_command(arguments)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first[0] is True and second[0] is True
+    assert len(started) == 1
+    assert started[0].commands == [
+        "c",
+        "rec",
+        "rs /images",
+        "play",
+        "rec",
+        "rs /images",
+        "play",
+    ]
+
+
+def test_session_detects_error_lines(tmp_path, monkeypatch):
+    """Test that only chdkptp's ERROR: lines mark a command as failed."""
+
+    def session():
+        return FakeSession(
+            responses={
+                "rec": b"NO_ERRORS mode\n",
+                "rs /images": b"ERROR: rs failed: timeout\n",
+            }
+        )
+
+    service, _ = _session_service(tmp_path, monkeypatch, [session])
+
+    async def run():
+        ok = await service.execute_chdkptp_command(["-erec"])
+        failed = await service.execute_chdkptp_command(["-ers /images"])
+        return ok, failed
+
+    ok, failed = asyncio.run(run())
+
+    assert ok[0] is True
+    assert failed[0] is False
+    assert failed[2] == "rs failed: timeout"
+
+
+def test_session_restarts_once_after_losing_the_process(tmp_path, monkeypatch):
+    """Test that a dead session is restarted once and the command retried."""
+    service, started = _session_service(
+        tmp_path,
+        monkeypatch,
+        [lambda: FakeSession(broken=True), FakeSession],
+    )
+
+    success, _, _ = asyncio.run(service.execute_chdkptp_command(["-erec"]))
+
+    assert success is True
+    assert len(started) == 2
+    assert started[1].commands == ["c", "rec"]
+
+
+def test_session_gives_up_after_one_restart(tmp_path, monkeypatch):
+    """Test that a session failing twice reports an error instead of looping."""
+    broken = [lambda: FakeSession(broken=True)] * 2
+    service, started = _session_service(tmp_path, monkeypatch, broken)
+
+    success, _, stderr = asyncio.run(service.execute_chdkptp_command(["-erec"]))
+
+    assert success is False
+    assert stderr == "chdkptp exited"
+    assert len(started) == 2
+
+
+def test_session_reconnects_when_camera_drops(tmp_path, monkeypatch):
+    """Test that a "not connected" error restarts the session once."""
+    service, started = _session_service(
+        tmp_path,
+        monkeypatch,
+        [
+            lambda: FakeSession(responses={"rec": b"ERROR: not connected\n"}),
+            FakeSession,
+        ],
+    )
+
+    success, _, _ = asyncio.run(service.execute_chdkptp_command(["-erec"]))
+
+    assert success is True
+    assert len(started) == 2
+
+
+def test_session_command_budget_covers_shooting_series():
+    """Test that a remote shoot series gets time for all of its shots."""
+    service = CHDKPTPSubprocessService("/chdkptp", command_timeout=30)
+
+    assert service._command_budget("rec") == 30
+    assert service._command_budget('rs "/a b" -shots=5 -int=2.5') == 42.5
+    assert service._command_budget("rs /a -shots=3") == 33
+
+
+def test_session_is_killed_when_a_command_hangs(tmp_path, monkeypatch):
+    """Test that a hung command times out, kills the session and frees the lock."""
+    service, started = _session_service(
+        tmp_path,
+        monkeypatch,
+        [lambda: FakeSession(hangs_on={"rs /images"}), FakeSession],
+        command_timeout=0.05,
+    )
+
+    async def run():
+        hung = await service.execute_chdkptp_command(["-ers /images"])
+        after = await service.execute_chdkptp_command(["-erec"])
+        return hung, after
+
+    hung, after = asyncio.run(run())
+
+    assert hung == (False, "", "CHDKPTP session command timed out")
+    assert started[0].returncode == -9
+    assert after[0] is True
+    assert len(started) == 2
+
+
+def test_session_is_shared_with_other_event_loops(tmp_path, monkeypatch):
+    """Test that a caller on another loop runs on the loop owning the session."""
+    service, started = _session_service(tmp_path, monkeypatch, [FakeSession])
+    owner_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=owner_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        first = asyncio.run_coroutine_threadsafe(
+            service.execute_chdkptp_command(["-erec"]), owner_loop
+        ).result(timeout=5)
+        second = asyncio.run(service.execute_chdkptp_command(["-eplay"]))
+    finally:
+        owner_loop.call_soon_threadsafe(owner_loop.stop)
+        thread.join(timeout=5)
+        owner_loop.close()
+
+    assert first[0] is True and second[0] is True
+    assert len(started) == 1
+    assert started[0].commands == ["c", "rec", "play"]
@@ -0,0 +1,34 @@
+import asyncio
+import threading
+import time
+
+from app.background.infrastructure.sun_event_monitor_service import (
+    SunEventMonitorService,
+)
+from app.background.infrastructure.sun_event_orchestrator import SunEventOrchestrator
+from app.sun_events.infrastructure.json_repository import JSONSunEventRepository
+
+
+def test_monitor_stops_promptly_from_another_thread():
+    """Test that stop() interrupts a long wait instead of sleeping it out."""
+    repository = JSONSunEventRepository()
+    monitor = SunEventMonitorService(
+        sun_event_repository=repository,
+        orchestrator=SunEventOrchestrator(repository, None, None, None),
+    )
+
+    async def long_cycle():
+        return 3600
+
+    monitor._execute_monitor_cycle = long_cycle
+
+    thread = threading.Thread(target=lambda: asyncio.run(monitor.start()))
+    thread.start()
+    time.sleep(0.1)
+
+    started = time.monotonic()
+    monitor.stop()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert time.monotonic() - started < 1
@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.background.infrastructure.sun_event_orchestrator import (
+    CAMERA_CONNECT_RETRIES,
+    SunEventOrchestrator,
+)
+from app.camera.domain.entities import AutoShootParams, CameraShootingResult
+from app.sun_events.domain.entities import SunEventPeriod
+from app.sun_events.infrastructure.json_repository import JSONSunEventRepository
+
+
+class FlakyCameraService:
+    """Camera service that reports connected after a number of failed probes."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.probes = 0
+
+    async def is_camera_connected(self) -> bool:
+        self.probes += 1
+        return self.probes > self.failures
+
+
+def test_orchestrator_retries_camera_connection():
+    """Test that a camera waking up shortly after period start is picked up."""
+    camera = FlakyCameraService(failures=1)
+    orchestrator = SunEventOrchestrator(JSONSunEventRepository(), None, camera, None)
+
+    assert asyncio.run(orchestrator._wait_for_camera_connection()) is True
+    assert camera.probes == 2
+
+
+def test_orchestrator_gives_up_on_disconnected_camera():
+    """Test that the connection check is bounded for a missing camera."""
+    camera = FlakyCameraService(failures=100)
+    orchestrator = SunEventOrchestrator(JSONSunEventRepository(), None, camera, None)
+
+    assert asyncio.run(orchestrator._wait_for_camera_connection()) is False
+    assert camera.probes == CAMERA_CONNECT_RETRIES + 1
+
+
+class RecordingCameraService:
+    """Connected camera that records the commands it executes."""
+
+    def __init__(self):
+        self.commands = []
+
+    async def is_camera_connected(self) -> bool:
+        return True
+
+    async def execute_command(self, command):
+        self.commands.append(command)
+        return CameraShootingResult(
+            success=True,
+            message="Auto shoot completed",
+            shooting_id=None,
+            image_path=None,
+            timestamp=datetime.now(),
+        )
+
+
+class RecordingVideoProcessor:
+    """Video processor that records the videos it was asked to create."""
+
+    def __init__(self, camera):
+        self.camera = camera
+        self.commands_at_processing = None
+
+    async def create_video_from_photos(self, **kwargs):
+        self.commands_at_processing = list(self.camera.commands)
+        return True
+
+
+def test_orchestrator_records_timelapse_for_the_period():
+    """Test that a period start runs an auto shoot sized for the period."""
+    camera = RecordingCameraService()
+    video_processor = RecordingVideoProcessor(camera)
+    orchestrator = SunEventOrchestrator(
+        JSONSunEventRepository(), None, camera, video_processor
+    )
+    now = datetime.now()
+    period = SunEventPeriod("sunset", now, now, now + timedelta(hours=1))
+    params = SimpleNamespace(photos_needed=600, interval_seconds=3.0)
+
+    async def run_period():
+        await orchestrator._start_camera_recording(period, params)
+        orchestrator._current_recording_period = period
+        await orchestrator.handle_period_end(period)
+        await orchestrator.shutdown()
+
+    asyncio.run(run_period())
+
+    assert [command.command_type for command in camera.commands] == ["auto_shoot"]
+    assert camera.commands[0].parameters == AutoShootParams(shots=600, interval=3.0)
+    assert video_processor.commands_at_processing == camera.commands
+
+
+def test_orchestrator_limits_late_recording_to_remaining_time():
+    """Test that a period joined late only shoots what still fits."""
+    camera = RecordingCameraService()
+    orchestrator = SunEventOrchestrator(JSONSunEventRepository(), None, camera, None)
+    now = datetime.now()
+    period = SunEventPeriod(
+        "sunset", now, now - timedelta(hours=1), now + timedelta(seconds=31)
+    )
+    params = SimpleNamespace(photos_needed=1200, interval_seconds=3.0)
+
+    async def start_recording():
+        await orchestrator._start_camera_recording(period, params)
+        await orchestrator._recording_task
+
+    asyncio.run(start_recording())
+
+    assert camera.commands[0].parameters == AutoShootParams(shots=10, interval=3.0)
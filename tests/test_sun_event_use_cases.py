@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from app.sun_events.application.use_cases import (
+    CheckUpcomingEventsRequest,
+    CheckUpcomingSunEventsUseCase,
+    GetCurrentEventRequest,
+    GetCurrentSunEventUseCase,
+)
+from app.sun_events.infrastructure.json_repository import JSONSunEventRepository
+
+
+class CountingRepository(JSONSunEventRepository):
+    """Repository that counts batched date lookups."""
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    def get_sun_events_by_dates(self, dates):
+        self.lookups += 1
+        return super().get_sun_events_by_dates(dates)
+
+
+def test_upcoming_events_reuse_cached_date_lookups():
+    """Test that repeated checks on the same day hit the repository once."""
+    repository = CountingRepository()
+    use_case = CheckUpcomingSunEventsUseCase(repository)
+
+    request = CheckUpcomingEventsRequest(
+        current_time=datetime(2025, 6, 28, 12, 0), look_ahead_minutes=24 * 60
+    )
+    first = use_case.execute(request)
+    second = use_case.execute(request)
+
+    assert repository.lookups == 1
+    assert first.upcoming_periods == second.upcoming_periods
+    assert first.upcoming_periods
+
+
+def test_upcoming_events_report_sorted_periods_and_bounds():
+    """Test that upcoming periods are ordered and their bounds are reported."""
+    use_case = CheckUpcomingSunEventsUseCase(JSONSunEventRepository())
+
+    response = use_case.execute(
+        CheckUpcomingEventsRequest(
+            current_time=datetime(2025, 6, 28, 12, 0), look_ahead_minutes=3 * 24 * 60
+        )
+    )
+
+    periods = response.upcoming_periods
+    start_times = [period.start_time for period in periods]
+    assert start_times == sorted(start_times)
+    assert response.earliest_start == periods[0].start_time
+    assert response.latest_end == max(period.end_time for period in periods)
+
+
+def test_current_period_is_found_from_precomputed_day_periods():
+    """Test that the current period is detected inside and outside a period."""
+    use_case = GetCurrentSunEventUseCase(JSONSunEventRepository())
+
+    during_sunset = use_case.execute(
+        GetCurrentEventRequest(current_time=datetime(2025, 6, 28, 22, 30))
+    )
+    at_noon = use_case.execute(
+        GetCurrentEventRequest(current_time=datetime(2025, 6, 28, 12, 0))
+    )
+    without_data = use_case.execute(
+        GetCurrentEventRequest(current_time=datetime(2025, 6, 27, 22, 30))
+    )
+
+    assert during_sunset.current_period.period_type == "sunset"
+    assert during_sunset.current_period.end_time == datetime(2025, 6, 28, 22, 56, 35)
+    assert at_noon.current_period is None
+    assert without_data.current_period is None
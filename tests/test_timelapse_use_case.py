@@ -0,0 +1,68 @@
+from datetime import datetime
+
+from app.sun_events.infrastructure.json_repository import JSONSunEventRepository
+from app.timelapse.application import use_cases
+from app.timelapse.application.use_cases import (
+    CalculateTimelapseRequest,
+    CalculateTimelapseUseCase,
+)
+
+
+class FixedDayRepository(JSONSunEventRepository):
+    """Repository that answers every day with one recorded sun event."""
+
+    def __init__(self):
+        super().__init__()
+        self.sun_event = super().get_sun_event_by_date_sync(datetime(2025, 6, 28))
+        self.lookups = []
+
+    def get_sun_event_by_date_sync(self, date):
+        self.lookups.append(date)
+        return self.sun_event
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() returns a time set by the test."""
+
+    frozen_now = datetime(2025, 6, 28, 12, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.frozen_now
+
+
+def test_timelapse_parameters_are_reused_for_identical_requests(monkeypatch):
+    """Test that repeated requests on the same day reuse the calculated result."""
+    monkeypatch.setattr(use_cases, "datetime", FrozenDatetime)
+    repository = FixedDayRepository()
+    use_case = CalculateTimelapseUseCase(repository)
+
+    first = use_case.execute(CalculateTimelapseRequest(period_type="sunset"))
+    second = use_case.execute(CalculateTimelapseRequest(period_type="sunset"))
+    other = use_case.execute(
+        CalculateTimelapseRequest(period_type="sunset", video_fps=30)
+    )
+
+    assert first.timelapse_parameters is second.timelapse_parameters
+    assert other.timelapse_parameters is not first.timelapse_parameters
+    assert other.timelapse_parameters.video_fps == 30
+    assert len(repository.lookups) == 2
+
+
+def test_timelapse_parameters_are_recalculated_on_a_new_day(monkeypatch):
+    """Test that the cache key includes the day, so results roll over daily."""
+    monkeypatch.setattr(use_cases, "datetime", FrozenDatetime)
+    repository = FixedDayRepository()
+    use_case = CalculateTimelapseUseCase(repository)
+    request = CalculateTimelapseRequest(period_type="sunrise")
+
+    monkeypatch.setattr(FrozenDatetime, "frozen_now", datetime(2025, 6, 28, 23, 59))
+    today = use_case.execute(request)
+    monkeypatch.setattr(FrozenDatetime, "frozen_now", datetime(2025, 6, 29, 0, 1))
+    tomorrow = use_case.execute(request)
+
+    assert tomorrow.timelapse_parameters is not today.timelapse_parameters
+    assert [lookup.date() for lookup in repository.lookups] == [
+        datetime(2025, 6, 28).date(),
+        datetime(2025, 6, 29).date(),
+    ]